@@ -7,7 +7,7 @@ from datetime import timedelta
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
@@ -255,18 +255,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         optimizer._optimization_interval
     )
 
+    async def _async_update_data():
+        """Run a cycle, then adopt the poll interval the optimizer picked."""
+        data = await optimizer.async_optimize()
+        poll_interval = timedelta(seconds=optimizer._poll_interval)
+        if coordinator.update_interval != poll_interval:
+            coordinator.update_interval = poll_interval
+        return data
+
     # Create coordinator for frequent data polling (independent of optimization)
     coordinator = DataUpdateCoordinator(
         hass,
         _LOGGER,
         name=DOMAIN,
-        update_method=optimizer.async_optimize,
+        update_method=_async_update_data,
         update_interval=timedelta(seconds=DEFAULT_DATA_POLL_INTERVAL),
     )
 
     # Setup optimizer (initializes learning manager with config)
     await optimizer.async_setup()
 
+    # Unload runs async_cleanup, but a Home Assistant stop doesn't: flush a
+    # pending debounced compressor state save so the on/off timestamps
+    # survive a restart
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, optimizer.async_flush_compressor_state)
+    )
+
     # Create and start critical room monitor
     critical_monitor = CriticalRoomMonitor(
         hass=hass,
@@ -333,7 +348,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 if config_entry_id in hass.data[DOMAIN]:
                     _LOGGER.info("Resetting smoothing for entry %s", config_entry_id)
                     optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                    optimizer._last_fan_speeds = {}
+                    await optimizer.async_reset_smoothing()
                 else:
                     _LOGGER.error("Config entry %s not found", config_entry_id)
             else:
@@ -341,7 +356,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 _LOGGER.info("Resetting smoothing for all entries")
                 for entry_id in list(hass.data[DOMAIN]):
                     optimizer = hass.data[DOMAIN][entry_id]["optimizer"]
-                    optimizer._last_fan_speeds = {}
+                    await optimizer.async_reset_smoothing()
 
         hass.services.async_register(DOMAIN, "reset_smoothing", async_reset_smoothing_service, SERVICE_SCHEMA_ENTRY_ID)
         _LOGGER.debug("Registered reset_smoothing service")
@@ -356,7 +371,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if config_entry_id in hass.data[DOMAIN]:
                 _LOGGER.info("Setting room override for %s in entry %s: enabled=%s", room_name, config_entry_id, enabled)
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                optimizer.room_overrides[f"{room_name}_enabled"] = enabled
+                async with optimizer.settings_guard():
+                    optimizer.room_overrides[f"{room_name}_enabled"] = enabled
             else:
                 _LOGGER.error("Config entry %s not found", config_entry_id)
 
@@ -455,8 +471,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
                 if optimizer.learning_manager:
-                    optimizer.learning_manager.enabled = True
-                    optimizer.learning_manager.learning_mode = mode
+                    async with optimizer.settings_guard():
+                        optimizer.learning_manager.enabled = True
+                        optimizer.learning_manager.learning_mode = mode
                     _LOGGER.info("Enabled learning in %s mode for entry %s", mode, config_entry_id)
                 else:
                     _LOGGER.warning("Learning manager not available for entry %s", config_entry_id)
@@ -474,7 +491,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
                 if optimizer.learning_manager:
-                    optimizer.learning_manager.enabled = False
+                    async with optimizer.settings_guard():
+                        optimizer.learning_manager.enabled = False
                     _LOGGER.info("Disabled learning for entry %s (data preserved)", config_entry_id)
                 else:
                     _LOGGER.warning("Learning manager not available for entry %s", config_entry_id)
@@ -485,7 +503,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 for eid, edata in hass.data[DOMAIN].items():
                     optimizer = edata.get("optimizer")
                     if optimizer and optimizer.learning_manager:
-                        optimizer.learning_manager.enabled = False
+                        async with optimizer.settings_guard():
+                            optimizer.learning_manager.enabled = False
                         _LOGGER.info("Disabled learning for entry %s (data preserved)", eid)
 
         hass.services.async_register(DOMAIN, "disable_learning", async_disable_learning_service, SERVICE_SCHEMA_ENTRY_ID)
@@ -499,10 +518,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                if enabled:
-                    optimizer._enter_quick_action_mode("vacation")
-                else:
-                    optimizer._exit_quick_action_mode()
+                async with optimizer.settings_guard():
+                    if enabled:
+                        optimizer._enter_quick_action_mode("vacation")
+                    else:
+                        optimizer._exit_quick_action_mode()
                 _LOGGER.info("Vacation mode %s for entry %s", "enabled" if enabled else "disabled", config_entry_id)
             else:
                 _LOGGER.error("Config entry %s not found", config_entry_id)
@@ -518,7 +538,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                optimizer._enter_quick_action_mode("boost", duration)
+                async with optimizer.settings_guard():
+                    optimizer._enter_quick_action_mode("boost", duration)
                 _LOGGER.info("Boost mode enabled for entry %s (duration: %d min)", config_entry_id, duration)
             else:
                 _LOGGER.error("Config entry %s not found", config_entry_id)
@@ -534,7 +555,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                optimizer._enter_quick_action_mode("sleep", duration)
+                async with optimizer.settings_guard():
+                    optimizer._enter_quick_action_mode("sleep", duration)
                 _LOGGER.info("Sleep mode enabled for entry %s (duration: %d min)", config_entry_id, duration)
             else:
                 _LOGGER.error("Config entry %s not found", config_entry_id)
@@ -550,7 +572,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             if config_entry_id and config_entry_id in hass.data[DOMAIN]:
                 optimizer = hass.data[DOMAIN][config_entry_id]["optimizer"]
-                optimizer._enter_quick_action_mode("party", duration)
+                async with optimizer.settings_guard():
+                    optimizer._enter_quick_action_mode("party", duration)
                 _LOGGER.info("Party mode enabled for entry %s (duration: %d min)", config_entry_id, duration)
             else:
                 _LOGGER.error("Config entry %s not found", config_entry_id)
@@ -169,8 +169,9 @@ class AirconAIClimate(CoordinatorEntity, ClimateEntity):
             )
             return
 
-        # Update optimizer
-        self._optimizer.target_temperature = temperature
+        # Update optimizer (between cycles, see AirconOptimizer.settings_guard)
+        async with self._optimizer.settings_guard():
+            self._optimizer.target_temperature = temperature
 
         # Persist to config entry
         from .const import CONF_TARGET_TEMPERATURE
@@ -183,7 +184,8 @@ class AirconAIClimate(CoordinatorEntity, ClimateEntity):
         """Set new target hvac mode."""
         if hvac_mode == HVACMode.OFF:
             self._is_on = False
-            self._optimizer.is_enabled = False
+            async with self._optimizer.settings_guard():
+                self._optimizer.is_enabled = False
             # If the manager is authorized to control the physical AC, turning
             # the manager off turns the AC off too — otherwise the AC keeps
             # running unmanaged in whatever state it was left in.
@@ -191,13 +193,14 @@ class AirconAIClimate(CoordinatorEntity, ClimateEntity):
                 await self._optimizer.async_turn_off_main_ac()
         else:
             self._is_on = True
-            self._optimizer.is_enabled = True
             self._attr_hvac_mode = hvac_mode
 
             # Propagate HVAC mode to optimizer so control logic uses the new mode
             mode_str = hvac_mode.value if hasattr(hvac_mode, 'value') else str(hvac_mode)
-            if mode_str in ("cool", "heat", "auto"):
-                self._optimizer.hvac_mode = mode_str
+            async with self._optimizer.settings_guard():
+                self._optimizer.is_enabled = True
+                if mode_str in ("cool", "heat", "auto"):
+                    self._optimizer.hvac_mode = mode_str
 
         # Persist state for restart recovery
         from .const import CONF_HVAC_MODE
@@ -45,6 +45,7 @@ class CriticalRoomMonitor:
         self.hass = hass
         self._config_data = config_data
         self._room_configs = room_configs
+        self._room_config_by_name = {r["room_name"]: r for r in room_configs}
         self._main_climate_entity = main_climate_entity
 
         # Track critical room states
@@ -101,11 +102,7 @@ class CriticalRoomMonitor:
 
         for room_name, critical_config in critical_rooms.items():
             # Find the room config
-            room_config = next(
-                (r for r in self._room_configs if r["room_name"] == room_name),
-                None
-            )
-
+            room_config = self._room_config_by_name.get(room_name)
             if not room_config:
                 continue
 
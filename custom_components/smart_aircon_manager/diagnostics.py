@@ -73,7 +73,7 @@ async def async_get_config_entry_diagnostics(
             "error_count": optimizer._error_count,
             "last_error": optimizer._last_error,
             "quick_action_mode": optimizer._quick_action_mode,
-            "manual_override": getattr(optimizer, 'manual_override_enabled', False),
+            "manual_override": optimizer.manual_override_enabled,
         }
 
     if coordinator and coordinator.data:
@@ -51,31 +51,59 @@ class PerformanceTracker:
             operating_mode: "cool" or "heat" — lets analysis separate seasons
                 so heating data doesn't pollute cooling metrics
         """
-        if room_name not in self._data_points:
-            self._data_points[room_name] = []
+        self.track_cycle_batch(
+            [(room_name, temp_before, temp_after, fan_speed, target_temp)],
+            cycle_duration,
+            operating_mode,
+        )
 
-        data_point = {
-            "timestamp": time.time(),
-            "temp_before": temp_before,
-            "temp_after": temp_after,
-            "fan_speed": fan_speed,
-            "target_temp": target_temp,
-            "cycle_duration": cycle_duration,
-            "temp_diff_from_target": temp_before - target_temp,
-            "operating_mode": operating_mode,
-        }
+    def track_cycle_batch(
+        self,
+        cycles: list[tuple[str, float, float | None, int, float]],
+        cycle_duration: float,
+        operating_mode: str | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Track one optimization cycle for several rooms at once.
 
-        # Add to room's data
-        self._data_points[room_name].append(data_point)
+        track_cycle delegates here, so this is the one place the data point
+        schema and the per-room limit live. Every data point shares a single
+        timestamp.
 
-        # Limit data points to prevent memory issues
-        if len(self._data_points[room_name]) > self._max_data_points_per_room:
-            self._data_points[room_name].pop(0)
+        Args:
+            cycles: (room_name, temp_before, temp_after, fan_speed, target_temp)
+                per room
+            cycle_duration: Time since last cycle (seconds)
+            operating_mode: "cool" or "heat", shared by all rooms this cycle
+            timestamp: Cycle time (defaults to now)
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        data_points = self._data_points
+        max_points = self._max_data_points_per_room
+
+        for room_name, temp_before, temp_after, fan_speed, target_temp in cycles:
+            room_points = data_points.get(room_name)
+            if room_points is None:
+                room_points = data_points[room_name] = []
+            room_points.append({
+                "timestamp": timestamp,
+                "temp_before": temp_before,
+                "temp_after": temp_after,
+                "fan_speed": fan_speed,
+                "target_temp": target_temp,
+                "cycle_duration": cycle_duration,
+                "temp_diff_from_target": temp_before - target_temp,
+                "operating_mode": operating_mode,
+            })
+            # Limit data points to prevent memory issues
+            if len(room_points) > max_points:
+                room_points.pop(0)
 
-        _LOGGER.debug(
-            "Tracked cycle for %s: temp=%.1f°C, fan=%d%%, target=%.1f°C",
-            room_name, temp_before, fan_speed, target_temp
-        )
+            _LOGGER.debug(
+                "Tracked cycle for %s: temp=%.1f°C, fan=%d%%, target=%.1f°C",
+                room_name, temp_before, fan_speed, target_temp
+            )
 
     def get_convergence_rate(
         self, room_name: str, time_window_hours: int = 24, mode: str | None = None
@@ -710,6 +738,8 @@ class LearningManager:
         self.storage_path = storage_path
         self.tracker = PerformanceTracker(hass, config_entry_id, storage_path)
         self.profiles = {}  # room_name -> LearningProfile
+        # Bumped whenever profiles are loaded or recalculated
+        self._profiles_version = 0
 
         # Learning configuration (defaults - will be overridden by config entry)
         self.enabled = False  # Disabled by default (opt-in)
@@ -731,6 +761,7 @@ class LearningManager:
                 data = json.loads(raw_data)
                 for room_name, profile_data in data.items():
                     self.profiles[room_name] = LearningProfile.from_dict(profile_data)
+                self._profiles_version += 1
                 _LOGGER.info("Loaded %d learning profiles", len(self.profiles))
             except Exception as e:
                 _LOGGER.error("Failed to load learning profiles: %s", e)
@@ -783,6 +814,8 @@ class LearningManager:
         updated_rooms, any_profile_modified = await self.hass.async_add_executor_job(
             self._update_profiles_sync
         )
+        # Confidence is refreshed even when nothing counts as "modified"
+        self._profiles_version += 1
 
         # Save profiles only when something meaningfully changed, to avoid
         # rewriting identical JSON to flash storage every hour.
@@ -818,6 +851,14 @@ class LearningManager:
         """Get learning profile for a room."""
         return self.profiles.get(room_name)
 
+    def learning_state_key(self) -> tuple:
+        """Key that changes whenever learned adjustments may change.
+
+        Covers profile recalculation as well as the runtime-togglable
+        settings that gate should_apply_learning.
+        """
+        return (self._profiles_version, self.enabled, self.learning_mode, self.confidence_threshold)
+
     def should_apply_learning(self, room_name: str) -> bool:
         """Check if learning should be applied for a room."""
         if not self.enabled or self.learning_mode != "active":
@@ -4,15 +4,23 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import math
 import statistics
 import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from datetime import time as dt_time
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.event import async_call_later
 
 from .learning import LearningManager
-from .temperature_utils import normalize_temperature, validate_temperature_range
+from .temperature_utils import celsius_conversion, normalize_temperature, validate_temperature_range
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +28,132 @@ _LOGGER = logging.getLogger(__name__)
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0  # seconds
 RETRY_BACKOFF_FACTOR = 2.0  # exponential backoff multiplier
+# Delay before each retry after the first attempt fails
+_RETRY_DELAYS = tuple(INITIAL_RETRY_DELAY * RETRY_BACKOFF_FACTOR ** i for i in range(MAX_RETRIES - 1))
+# Cover commands in flight at once, so large houses don't flood the cover
+# integration (often a single hub or cloud API) in one burst
+_MAX_CONCURRENT_COVER_CALLS = 8
+
+# Climate entity states used to decide whether the main AC is running
+_RUNNING_ACTIONS = frozenset({"cooling", "heating", "drying", "fan"})
+_INACTIVE_MODES = frozenset({"off", "unavailable"})
+
+# Room count from which _calculate_recommendations runs in the executor
+# rather than on the event loop (below this the hand-off costs more)
+_EXECUTOR_ROOM_THRESHOLD = 8
+
+# Data poll interval scaling: stretched while every room is stable,
+# compressed while room temperatures are diverging
+_STABLE_POLL_FACTOR = 4.0
+_DIVERGING_POLL_FACTOR = 0.25
+
+# Room temperature history kept for rate-of-change, in base data polls
+# (5 minutes at the default 30s poll). Bounded by age rather than point
+# count so the adaptive poll doesn't stretch or shrink the window.
+_TEMP_HISTORY_POLLS = 10
+
+# Sensor/attribute values that carry no usable reading
+_UNKNOWN_STATES = frozenset({"unknown", "unavailable", "none", None})
+
+# Notifications raised within this window are coalesced per title
+_NOTIFICATION_BATCH_SECONDS = 3.0
+
+# Compressor on/off timestamps changed within this window share one disk write
+_COMPRESSOR_SAVE_DELAY_SECONDS = 5.0
+
+# Schedule day names, indexed like datetime.weekday()
+_WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Occupancy sensor states that count as the room being occupied
+_OCCUPIED_STATES = frozenset({"on", "home", "occupied", "detected", "motion", "true"})
+
+# Quick action modes and their default durations in minutes (None = manual exit only)
+_QUICK_ACTION_DEFAULT_DURATIONS = {
+    "vacation": None,
+    "boost": 30,
+    "sleep": 480,  # 8 hours
+    "party": 120,  # 2 hours
+}
+
+
+# Fan speed per overshoot tier, indexed by bisect over the tier thresholds
+# (index 0 — below tier1 — is the tapered range computed separately)
+_OVERSHOOT_TIER_SPEEDS = (None, 22, 12, 5)
+
+# Outdoor temperature bands for the weather target adjustment. The band
+# index is bisect_right over the cold bounds (below 15 / below 20) plus
+# bisect_left over the hot bounds (above 25 / above 30), so 15-25°C
+# inclusive behave exactly as the band edges are documented.
+_WEATHER_COLD_BOUNDS = (15.0, 20.0)
+_WEATHER_HOT_BOUNDS = (25.0, 30.0)
+_WEATHER_BANDS = (("Cold", 0.5), ("Cool", 0.25), ("Mild", 0.0), ("Warm", -0.25), ("Hot", -0.5))
+
+# Default temperature bands (in degrees from target)
+_DEFAULT_TEMPERATURE_BANDS = {
+    'extreme': 4.0,      # 4°C+ away
+    'very_high': 3.0,    # 3-4°C away
+    'high': 2.0,         # 2-3°C away
+    'moderate': 1.5,     # 1.5-2°C away
+    'slight': 1.0,       # 1-1.5°C away
+    'minimal': 0.7,      # 0.7-1°C away
+    'very_minimal': 0.5, # 0.5-0.7°C away
+}
+
+
+@lru_cache(maxsize=32)
+def _notification_ids(title: str) -> tuple[str, str]:
+    """Return (display title, persistent notification ID) for a notification title.
+
+    Titles come from a small fixed set, so each pair is built only once.
+    """
+    return (
+        f"Smart Aircon Manager: {title}",
+        f"smart_aircon_manager_{title.lower().replace(' ', '_')}",
+    )
+
+
+@dataclass(slots=True)
+class RoomOccupancy:
+    """Tracked occupancy for a single room."""
+
+    occupied: bool
+    last_seen: float | None  # Timestamp the room was last seen occupied
+
+
+@dataclass(frozen=True, slots=True)
+class RoomSpec:
+    """Entity IDs and static settings for a configured room."""
+
+    name: str
+    temp_sensor: str
+    cover_entity: str
+    humidity_sensor: str | None = None
+    target: float | None = None  # Per-room target override
+
+    @classmethod
+    def from_config(cls, room: dict[str, Any]) -> RoomSpec:
+        """Build a spec from a room_configs entry."""
+        return cls(
+            name=room["room_name"],
+            temp_sensor=room["temperature_sensor"],
+            cover_entity=room["cover_entity"],
+            humidity_sensor=room.get("humidity_sensor"),
+            target=room.get("room_target_temperature"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TempStats:
+    """Mean/min/max of one cycle's valid room temperatures."""
+
+    mean: float
+    minimum: float
+    maximum: float
+
+    @classmethod
+    def from_temps(cls, temps: list[float]) -> TempStats:
+        """Summarise a non-empty temperature list."""
+        return cls(sum(temps) / len(temps), min(temps), max(temps))
 
 
 class AirconOptimizer:
@@ -104,11 +238,48 @@ class AirconOptimizer:
         # Validate and store configuration parameters
         self.target_temperature = self._validate_temperature(target_temperature, "target_temperature", 10.0, 35.0)
         self.room_configs = room_configs
+        # Room entity lookups resolved once; room_configs don't change for
+        # the lifetime of the optimizer (options updates reload the entry)
+        self._room_specs = tuple(RoomSpec.from_config(room) for room in room_configs)
+        self._room_spec_by_name = {spec.name: spec for spec in self._room_specs}
+        # room_name -> (smoothing factor, threshold), valid for _smoothing_cache_key
+        self._smoothing_params_cache: dict[str, tuple[float, int]] = {}
+        self._smoothing_cache_key: tuple | None = None
+        # room_name -> (learning state key, bands) for _get_adaptive_temperature_bands
+        self._bands_cache: dict[str, tuple[tuple, dict[str, float]]] = {}
+        # room_name -> (learning state key, boost) for _get_adaptive_predictive_boost
+        self._boost_cache: dict[str, tuple[tuple, float]] = {}
+        # room_name -> (learning state key, efficiency, clamped adjustment or
+        # None without a usable profile) for _apply_efficiency_adjustment
+        self._efficiency_cache: dict[str, tuple[tuple, float, float | None]] = {}
+        # ((learning state key, room names), average) for _get_house_cooling_efficiency
+        self._house_efficiency_cache: tuple[tuple, float | None] | None = None
+        # Per temperature sensor: (unit, scale, offset) converting readings to °C
+        self._sensor_unit_scale: dict[str, tuple[str, float, float]] = {}
         self.main_climate_entity = main_climate_entity
         self.main_fan_entity = main_fan_entity
+        # Display names passed to _retry_service_call for logs and errors
+        self._main_ac_name = f"Main AC ({main_climate_entity})"
+        self._main_ac_mode_name = f"Main AC Mode ({main_climate_entity})"
+        self._main_ac_temp_name = f"Main AC Temperature ({main_climate_entity})"
+        self._main_fan_name = f"Main Fan ({main_fan_entity})"
         self.temperature_deadband = self._validate_positive_float(temperature_deadband, "temperature_deadband", 0.1, 5.0)
         self.hvac_mode = hvac_mode if hvac_mode in ["cool", "heat", "auto"] else "cool"
         self.is_enabled = True  # Can be set to False by climate entity when OFF
+        self.manual_override_enabled = False  # Restored/toggled by the manual override switch
+        # Notifications waiting for the batch window: title -> unique messages
+        self._pending_notifications: dict[str, list[str]] = {}
+        self._notification_flush_unsub = None
+        self._compressor_save_unsub = None  # Pending debounced state save
+        self._state_file: Path | None = None  # Resolved on first load/save
+        self._cover_call_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_COVER_CALLS)
+        # Serialises optimization cycles: the recommendation pass can run in
+        # the executor (see _EXECUTOR_ROOM_THRESHOLD), mutating per-room state
+        # and reading settings from a worker thread. A forced refresh must not
+        # start a second cycle under it, and settings changes from services
+        # and entities take it too (see settings_guard) so they land between
+        # cycles rather than part-way through a pass.
+        self._optimize_lock = asyncio.Lock()
         self.auto_control_main_ac = auto_control_main_ac
         self.auto_control_ac_temperature = auto_control_ac_temperature
         self.enable_notifications = enable_notifications
@@ -121,6 +292,9 @@ class AirconOptimizer:
         self.outdoor_temp_sensor = outdoor_temp_sensor
         self.enable_scheduling = enable_scheduling
         self.schedules = schedules or []
+        self._compiled_schedules = self._compile_schedules(self.schedules)
+        # (minute, schedule) memo for _get_active_schedule
+        self._schedule_cache: tuple[Any, dict[str, Any] | None] = (None, None)
         self.main_fan_high_threshold = self._validate_positive_float(main_fan_high_threshold, "main_fan_high_threshold", 0.1, 10.0)
         self.main_fan_medium_threshold = self._validate_positive_float(main_fan_medium_threshold, "main_fan_medium_threshold", 0.1, 10.0)
         self.weather_influence_factor = self._validate_positive_float(weather_influence_factor, "weather_influence_factor", 0.0, 1.0)
@@ -142,6 +316,10 @@ class AirconOptimizer:
                 "Corrected overshoot thresholds to: tier1=%.1f, tier2=%.1f, tier3=%.1f",
                 self.overshoot_tier1_threshold, self.overshoot_tier2_threshold, self.overshoot_tier3_threshold
             )
+        # Sorted tier boundaries for bisect lookup in _overshoot_fan_speed
+        self._overshoot_tier_bounds = (
+            self.overshoot_tier1_threshold, self.overshoot_tier2_threshold, self.overshoot_tier3_threshold
+        )
 
         # Inter-room balancing configuration
         self.enable_room_balancing = enable_room_balancing
@@ -171,7 +349,7 @@ class AirconOptimizer:
         self.mode_change_hysteresis_time = max(0, float(mode_change_hysteresis_time))
         self.mode_change_hysteresis_temp = self._validate_positive_float(mode_change_hysteresis_temp, "mode_change_hysteresis_temp", 0.0, 2.0)
         self._last_hvac_mode = None
-        self._last_mode_change_time = None
+        self._last_mode_change_time = 0.0  # Set together with _last_hvac_mode
         # Last cool/heat resolution — survives dry/fan_only interludes so damper
         # and setback direction stays correct while circulating in auto mode.
         self._last_active_operating_mode = None
@@ -181,14 +359,16 @@ class AirconOptimizer:
         self.occupancy_sensors = occupancy_sensors or {}
         self.vacant_room_setback = self._validate_positive_float(vacant_room_setback, "vacant_room_setback", 0.0, 5.0)
         self.vacancy_timeout = max(0, float(vacancy_timeout))
-        self._room_occupancy_state = {}  # room_name -> {"occupied": bool, "last_seen": timestamp}
+        self._room_occupancy_state: dict[str, RoomOccupancy] = {}
 
         # Compressor protection
         self.enable_compressor_protection = enable_compressor_protection
         self.compressor_min_on_time = max(0, float(compressor_min_on_time))
         self.compressor_min_off_time = max(0, float(compressor_min_off_time))
-        self._ac_last_turned_on = None   # Timestamp when AC was last turned on
-        self._ac_last_turned_off = None  # Timestamp when AC was last turned off
+        # time.monotonic() when the AC was last turned on/off; converted to
+        # wall-clock only when persisted, so clock steps can't skew protection
+        self._ac_last_turned_on = None
+        self._ac_last_turned_off = None
 
         # Enhanced compressor protection (reduces mode change frequency)
         self.enable_enhanced_compressor_protection = enable_enhanced_compressor_protection
@@ -261,8 +441,11 @@ class AirconOptimizer:
         self.predictive_boost_factor = self._validate_positive_float(
             predictive_boost_factor, "predictive_boost_factor", 0.0, 1.0
         )
-        self._temp_history = {}  # room_name -> list of (timestamp, temp) tuples
-        self._max_history_points = 10  # Keep last 10 readings per room
+        self._temp_history: dict[str, deque[tuple[float, float]]] = {}  # room_name -> (timestamp, temp)
+        # Memory cap only: a full history window at the fastest adaptive poll
+        self._max_history_points = int(_TEMP_HISTORY_POLLS / _DIVERGING_POLL_FACTOR)
+        # room_name -> ((history length, newest point), rate) for _get_temp_rate_of_change
+        self._rate_of_change_cache: dict[str, tuple[tuple, float | None]] = {}
 
         # Smart learning improvements
         self.enable_adaptive_bands = enable_adaptive_bands
@@ -276,17 +459,52 @@ class AirconOptimizer:
 
         # Configurable notification services
         self.notify_services = notify_services or []
+        # (configured name, notify service name) pairs, split once here
+        self._notify_targets = tuple(
+            (service, service.removeprefix("notify.")) for service in self.notify_services
+        )
+
+        # Entities whose changes can alter a stable cycle's outcome
+        self._watched_entities = tuple(
+            entity_id
+            for spec in self._room_specs
+            for entity_id in (spec.temp_sensor, spec.humidity_sensor, spec.cover_entity)
+            if entity_id
+        ) + tuple(
+            entity_id
+            for entity_id in (
+                self.main_climate_entity,
+                self.outdoor_temp_sensor,
+                self.weather_entity,
+                *self.occupancy_sensors.values(),
+            )
+            if entity_id
+        )
 
         self._last_optimization_response = None
+        self._last_summary_key: tuple | None = None  # Inputs behind _last_optimization_response
         self._last_error = None
         self._error_count = 0
         self._startup_time = None
-        from .const import DEFAULT_STARTUP_DELAY, DEFAULT_UPDATE_INTERVAL
+        from .const import DEFAULT_DATA_POLL_INTERVAL, DEFAULT_STARTUP_DELAY, DEFAULT_UPDATE_INTERVAL
         self._startup_delay_seconds = DEFAULT_STARTUP_DELAY
+        # Coordinator poll interval (seconds); the base is rescaled each cycle
+        # by _update_poll_interval and applied by the coordinator wrapper
+        self._base_poll_interval = float(DEFAULT_DATA_POLL_INTERVAL)
+        self._poll_interval = self._base_poll_interval
         self._last_optimization = None
         self._optimization_interval = DEFAULT_UPDATE_INTERVAL * 60
         self._last_recommendations = {}
         self._last_main_fan_speed = None
+        # Stable-cycle reuse: when every watched entity is unchanged since a
+        # cycle that found all rooms stable, its result is returned as-is
+        self._last_input_fingerprint: tuple | None = None
+        self._last_stable_result: dict[str, Any] | None = None
+        self._last_stable_result_time: float | None = None
+        # (temps list, TempStats) for the cycle's valid_temps, shared by helpers
+        self._temp_stats_cache: tuple[list[float], TempStats] | None = None
+        # (room_states, valid temps) of the current cycle, see _valid_temps
+        self._cycle_temps: tuple[dict[str, dict[str, Any]], list[float]] | None = None
         self._current_schedule = None
         # Global effective target (schedule + weather, NO per-room weighting).
         # Refreshed each optimization cycle by _async_optimize_impl. Falls back
@@ -305,7 +523,10 @@ class AirconOptimizer:
 
         # Adaptive learning
         self.learning_manager = None  # Will be initialized in async_setup
-        self._last_room_temps = {}  # Track temps for learning
+        # Last temperature per room for learning, aligned with _room_specs
+        # (sized to the configured rooms, so it never holds stale entries)
+        self._room_index = {spec.name: idx for idx, spec in enumerate(self._room_specs)}
+        self._last_room_temps: list[float | None] = [None] * len(self._room_specs)
         self._last_learning_update = None  # Track when we last updated learning profiles
         self._learning_update_interval = 3600  # Update learning profiles every hour
 
@@ -346,24 +567,51 @@ class AirconOptimizer:
 
     def _validate_sensor_temperature(self, value: Any, room_name: str) -> float | None:
         """Validate temperature reading from sensor with sanity checks."""
-        if value is None or value in ["unknown", "unavailable", "none"]:
+        # Fast path: readings arrive here already converted to float °C
+        if isinstance(value, float):
+            temp = value
+        else:
+            try:
+                if value in _UNKNOWN_STATES:
+                    return None
+                temp = float(value)
+            except (ValueError, TypeError) as e:
+                _LOGGER.warning("Could not parse temperature for %s: %s", room_name, e)
+                return None
+
+        # Sanity check: realistic temperature range (-50°C to 70°C)
+        if not (-50.0 <= temp <= 70.0):
+            _LOGGER.warning(
+                "Temperature reading for %s (%.1f°C) outside realistic range, ignoring",
+                room_name, temp
+            )
             return None
 
-        try:
-            temp = float(value)
+        return temp
 
-            # Sanity check: realistic temperature range (-50°C to 70°C)
-            if not (-50.0 <= temp <= 70.0):
-                _LOGGER.warning(
-                    "Temperature reading for %s (%.1f°C) outside realistic range, ignoring",
-                    room_name, temp
-                )
-                return None
+    def _room_temperature_celsius(self, temp_state: Any, sensor: str, room_name: str) -> float | None:
+        """Read a room temperature sensor state in °C.
 
-            return temp
-        except (ValueError, TypeError) as e:
-            _LOGGER.warning("Could not parse temperature for %s: %s", room_name, e)
+        The unit conversion is cached per sensor and only recomputed when the
+        sensor's unit_of_measurement changes.
+        """
+        raw_value = temp_state.state
+        if raw_value in _UNKNOWN_STATES:
             return None
+        try:
+            value = float(raw_value)
+        except (ValueError, TypeError) as err:
+            _LOGGER.warning(
+                "Could not parse temperature for %s: %s (error: %s)", room_name, raw_value, err
+            )
+            return None
+
+        unit = temp_state.attributes.get("unit_of_measurement", "°C")
+        cached = self._sensor_unit_scale.get(sensor)
+        if cached is None or cached[0] != unit:
+            cached = (unit, *celsius_conversion(unit))
+            self._sensor_unit_scale[sensor] = cached
+        return value * cached[1] + cached[2]
 
     async def async_setup(self) -> None:
         """Set up the optimizer."""
@@ -461,8 +709,8 @@ class AirconOptimizer:
         caches_to_clean = [
             ("_last_fan_speeds", self._last_fan_speeds),
             ("_temp_history", self._temp_history),
+            ("_rate_of_change_cache", self._rate_of_change_cache),
             ("_last_recommendations", self._last_recommendations),
-            ("_last_room_temps", self._last_room_temps),
             ("_room_occupancy_state", self._room_occupancy_state),
         ]
 
@@ -480,12 +728,18 @@ class AirconOptimizer:
             _LOGGER.info("Cleaned up %d cache entries for %d deleted rooms: %s",
                         total_removed, len(stale_rooms), ", ".join(stale_rooms))
 
+    def _compressor_state_file(self) -> Path:
+        """Return this entry's persisted state file, resolving it once."""
+        if self._state_file is None:
+            storage_path = Path(self.hass.config.path(".storage"))
+            config_entry_id = self.config_entry.entry_id if self.config_entry else "default"
+            self._state_file = storage_path / f"smart_aircon_manager.{config_entry_id}.state.json"
+        return self._state_file
+
     async def _load_compressor_state(self) -> None:
         """Load persisted compressor protection timestamps from storage."""
         try:
-            storage_path = Path(self.hass.config.path(".storage"))
-            config_entry_id = self.config_entry.entry_id if self.config_entry else "default"
-            state_file = storage_path / f"smart_aircon_manager.{config_entry_id}.state.json"
+            state_file = self._compressor_state_file()
 
             def _load():
                 if not state_file.exists():
@@ -501,17 +755,18 @@ class AirconOptimizer:
                 current_time = time.time()
                 max_age = 86400  # 24 hours
 
+                # Stored as wall-clock; rebase onto the monotonic clock
                 if 'ac_last_turned_on' in data and data['ac_last_turned_on']:
-                    if current_time - data['ac_last_turned_on'] < max_age:
-                        self._ac_last_turned_on = data['ac_last_turned_on']
-                        _LOGGER.debug("Restored AC last turned on timestamp: %.0f seconds ago",
-                                     current_time - self._ac_last_turned_on)
+                    age = max(0.0, current_time - data['ac_last_turned_on'])
+                    if age < max_age:
+                        self._ac_last_turned_on = time.monotonic() - age
+                        _LOGGER.debug("Restored AC last turned on timestamp: %.0f seconds ago", age)
 
                 if 'ac_last_turned_off' in data and data['ac_last_turned_off']:
-                    if current_time - data['ac_last_turned_off'] < max_age:
-                        self._ac_last_turned_off = data['ac_last_turned_off']
-                        _LOGGER.debug("Restored AC last turned off timestamp: %.0f seconds ago",
-                                     current_time - self._ac_last_turned_off)
+                    age = max(0.0, current_time - data['ac_last_turned_off'])
+                    if age < max_age:
+                        self._ac_last_turned_off = time.monotonic() - age
+                        _LOGGER.debug("Restored AC last turned off timestamp: %.0f seconds ago", age)
 
                 # Restore quick action state if not expired
                 if data.get('quick_action_mode') and data.get('quick_action_expiry'):
@@ -550,16 +805,44 @@ class AirconOptimizer:
             _LOGGER.warning("Failed to load compressor state: %s", e)
             # Don't fail startup, just log and continue
 
+    def _schedule_compressor_state_save(self) -> None:
+        """Save compressor state after a short delay, coalescing rapid changes."""
+        if self._compressor_save_unsub is None:
+            self._compressor_save_unsub = async_call_later(
+                self.hass, _COMPRESSOR_SAVE_DELAY_SECONDS, self._async_deferred_compressor_save
+            )
+
+    async def async_flush_compressor_state(self, _event=None) -> None:
+        """Write a pending debounced compressor state save immediately.
+
+        Registered for Home Assistant stop: the async_call_later timer is
+        dropped at shutdown, which would lose a recent AC on/off timestamp.
+        """
+        if self._compressor_save_unsub is None:
+            return
+        self._compressor_save_unsub()
+        self._compressor_save_unsub = None
+        await self._save_compressor_state()
+
+    async def _async_deferred_compressor_save(self, _now=None) -> None:
+        """Run the save scheduled by _schedule_compressor_state_save."""
+        self._compressor_save_unsub = None
+        await self._save_compressor_state()
+
     async def _save_compressor_state(self) -> None:
         """Save compressor protection timestamps to storage."""
         try:
-            storage_path = Path(self.hass.config.path(".storage"))
-            config_entry_id = self.config_entry.entry_id if self.config_entry else "default"
-            state_file = storage_path / f"smart_aircon_manager.{config_entry_id}.state.json"
+            state_file = self._compressor_state_file()
 
+            # Persist wall-clock times so they remain meaningful after a restart
+            wall_offset = time.time() - time.monotonic()
             data = {
-                'ac_last_turned_on': self._ac_last_turned_on,
-                'ac_last_turned_off': self._ac_last_turned_off,
+                'ac_last_turned_on': (
+                    self._ac_last_turned_on + wall_offset if self._ac_last_turned_on is not None else None
+                ),
+                'ac_last_turned_off': (
+                    self._ac_last_turned_off + wall_offset if self._ac_last_turned_off is not None else None
+                ),
                 'quick_action_mode': self._quick_action_mode,
                 'quick_action_expiry': self._quick_action_expiry,
                 'quick_action_original_settings': self._quick_action_original_settings,
@@ -575,7 +858,7 @@ class AirconOptimizer:
                 # mid-write leaves the previous valid file intact instead of
                 # corrupting the destination, so the next startup never sees
                 # a half-written JSON document.
-                storage_path.mkdir(parents=True, exist_ok=True)
+                state_file.parent.mkdir(parents=True, exist_ok=True)
                 tmp_file = state_file.with_suffix(state_file.suffix + ".tmp")
                 with open(tmp_file, 'w') as f:
                     json.dump(data, f, indent=2)
@@ -599,141 +882,133 @@ class AirconOptimizer:
 
         Returns True if successful, False if all retries exhausted.
         """
-        last_exception = None
+        # Fast path: the first attempt almost always succeeds
+        try:
+            await self.hass.services.async_call(domain, service, service_data, blocking=True)
+            return True
+        except Exception as e:
+            last_exception = e
 
-        for attempt in range(MAX_RETRIES):
+        for attempt, delay in enumerate(_RETRY_DELAYS, start=1):
+            _LOGGER.warning(
+                "Failed to call %s.%s for %s (attempt %d/%d): %s. Retrying in %.1fs...",
+                domain, service, entity_name, attempt, MAX_RETRIES, last_exception, delay
+            )
+            await asyncio.sleep(delay)
             try:
-                await self.hass.services.async_call(
-                    domain,
-                    service,
-                    service_data,
-                    blocking=True,
-                )
-
-                if attempt > 0:
-                    _LOGGER.info(
-                        "Successfully called %s.%s for %s on attempt %d",
-                        domain, service, entity_name, attempt + 1
-                    )
-
-                return True
-
+                await self.hass.services.async_call(domain, service, service_data, blocking=True)
             except Exception as e:
                 last_exception = e
-
-                if attempt < MAX_RETRIES - 1:
-                    delay = INITIAL_RETRY_DELAY * (RETRY_BACKOFF_FACTOR ** attempt)
-                    _LOGGER.warning(
-                        "Failed to call %s.%s for %s (attempt %d/%d): %s. Retrying in %.1fs...",
-                        domain, service, entity_name, attempt + 1, MAX_RETRIES, e, delay
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    _LOGGER.error(
-                        "Failed to call %s.%s for %s after %d attempts: %s",
-                        domain, service, entity_name, MAX_RETRIES, e
-                    )
+                continue
+            _LOGGER.info(
+                "Successfully called %s.%s for %s on attempt %d",
+                domain, service, entity_name, attempt + 1
+            )
+            return True
 
         # All retries exhausted
+        _LOGGER.error(
+            "Failed to call %s.%s for %s after %d attempts: %s",
+            domain, service, entity_name, MAX_RETRIES, last_exception
+        )
         self._last_error = f"Service call failed after {MAX_RETRIES} attempts: {last_exception}"
         self._error_count += 1
         return False
 
-    def _get_active_schedule(self) -> dict[str, Any] | None:
-        """Get the currently active schedule based on time and day.
-
-        When multiple schedules match, the most specific day match wins:
+    @staticmethod
+    def _compile_schedules(
+        schedules: list[dict[str, Any]],
+    ) -> list[tuple[dt_time, dt_time, tuple[int, ...], dict[str, Any]]]:
+        """Pre-parse enabled schedules into (start, end, day priorities, schedule).
+
+        Day priorities hold the specificity of the schedule's match for each
+        weekday (indexed like ``datetime.weekday()``, 0 = no match), so the
+        most specific day match wins:
         - Specific day (e.g. "monday") beats "weekdays"/"weekends"
         - "weekdays"/"weekends" beats "all"
         """
-        if not self.enable_scheduling or not self.schedules:
-            return None
-
-        from homeassistant.util import dt as dt_util
-        from datetime import timedelta
-        now = dt_util.now()
-        current_time = now.time()
-        current_day = now.strftime("%A").lower()
-        # For overnight schedules (start > end), the second half of the schedule
-        # logically belongs to the previous calendar day. A "Mon 22:00–06:00"
-        # schedule must still be considered active on Tuesday at 03:00. We
-        # resolve this by also checking yesterday's day name when the current
-        # clock time is in the morning leg of an overnight window.
-        yesterday_day = (now - timedelta(days=1)).strftime("%A").lower()
-
-        WEEKDAYS = {"monday", "tuesday", "wednesday", "thursday", "friday"}
-        WEEKENDS = {"saturday", "sunday"}
-
-        def _day_priority(day_name: str, schedule_days: list[str]) -> int | None:
-            """Return specificity priority of a day match, or None if no match."""
-            if day_name in schedule_days:
-                return 3  # Exact day name
-            if "weekdays" in schedule_days and day_name in WEEKDAYS:
-                return 2
-            if "weekends" in schedule_days and day_name in WEEKENDS:
-                return 2
-            if "all" in schedule_days:
-                return 1
-            return None
-
-        best_schedule = None
-        best_priority = -1  # Higher = more specific
-
-        for schedule in self.schedules:
+        compiled = []
+        for schedule in schedules:
             if not schedule.get("schedule_enabled", True):
                 continue
 
             schedule_days = schedule.get("schedule_days", [])
-            if not schedule_days:
-                continue
-
-            # Check time range
             start_time = schedule.get("schedule_start_time")
             end_time = schedule.get("schedule_end_time")
-
-            if not start_time or not end_time:
+            if not schedule_days or not start_time or not end_time:
                 continue
 
             try:
-                from datetime import time as dt_time
                 start_hour, start_min = map(int, start_time.split(":"))
                 end_hour, end_min = map(int, end_time.split(":"))
                 start_t = dt_time(start_hour, start_min)
                 end_t = dt_time(end_hour, end_min)
+            except (ValueError, AttributeError) as e:
+                _LOGGER.warning("Invalid schedule time format: %s", e)
+                continue
 
-                time_match = False
-                # For day matching, the schedule's "anchor day" is the day on
-                # which it starts. For overnight schedules the anchor day is
-                # yesterday if we're past midnight but before the end time.
-                anchor_day = current_day
-                if start_t <= end_t:
-                    # Same-day schedule
-                    time_match = start_t <= current_time <= end_t
-                else:
-                    # Overnight schedule
-                    if current_time >= start_t:
-                        # Evening leg — anchor day is today
-                        time_match = True
-                        anchor_day = current_day
-                    elif current_time <= end_t:
-                        # Morning leg — anchor day is yesterday
-                        time_match = True
-                        anchor_day = yesterday_day
-
-                if not time_match:
-                    continue
+            day_priority = [1 if "all" in schedule_days else 0] * 7
+            if "weekdays" in schedule_days:
+                day_priority[0:5] = [2] * 5
+            if "weekends" in schedule_days:
+                day_priority[5:7] = [2] * 2
+            for weekday, day_name in enumerate(_WEEKDAY_NAMES):
+                if day_name in schedule_days:
+                    day_priority[weekday] = 3  # Exact day name
 
-                priority = _day_priority(anchor_day, schedule_days)
-                if priority is None:
-                    continue
+            compiled.append((start_t, end_t, tuple(day_priority), schedule))
+        return compiled
 
-                if priority > best_priority:
-                    best_schedule = schedule
-                    best_priority = priority
-            except (ValueError, AttributeError) as e:
-                _LOGGER.warning("Invalid schedule time format: %s", e)
+    def _get_active_schedule(self) -> dict[str, Any] | None:
+        """Get the currently active schedule based on time and day.
+
+        Schedule times have minute resolution, so the result is evaluated
+        for the current minute and memoised until the minute changes.
+        """
+        if not self.enable_scheduling or not self._compiled_schedules:
+            return None
+
+        from homeassistant.util import dt as dt_util
+        now = dt_util.now().replace(second=0, microsecond=0)
+        cached_minute, cached_schedule = self._schedule_cache
+        if now == cached_minute:
+            return cached_schedule
+
+        current_time = now.time()
+        current_day = now.weekday()
+        # For overnight schedules (start > end), the second half of the schedule
+        # logically belongs to the previous calendar day. A "Mon 22:00–06:00"
+        # schedule must still be considered active on Tuesday at 03:00. We
+        # resolve this by also checking yesterday's weekday when the current
+        # clock time is in the morning leg of an overnight window.
+        yesterday_day = (current_day - 1) % 7
+
+        best_schedule = None
+        best_priority = -1  # Higher = more specific
+
+        for start_t, end_t, day_priority, schedule in self._compiled_schedules:
+            # For day matching, the schedule's "anchor day" is the day on
+            # which it starts. For overnight schedules the anchor day is
+            # yesterday if we're past midnight but before the end time.
+            if start_t <= end_t:
+                # Same-day schedule
+                if not start_t <= current_time <= end_t:
+                    continue
+                anchor_day = current_day
+            elif current_time >= start_t:
+                # Overnight schedule, evening leg — anchor day is today
+                anchor_day = current_day
+            elif current_time <= end_t:
+                # Overnight schedule, morning leg — anchor day is yesterday
+                anchor_day = yesterday_day
+            else:
                 continue
 
+            priority = day_priority[anchor_day]
+            if priority and priority > best_priority:
+                best_schedule = schedule
+                best_priority = priority
+
         if best_schedule:
             _LOGGER.debug(
                 "Active schedule found: %s (priority: %d)",
@@ -741,6 +1016,7 @@ class AirconOptimizer:
                 best_priority
             )
 
+        self._schedule_cache = (now, best_schedule)
         return best_schedule
 
     def _outlier_conditioning_mode(self, temps: list[float], effective_target: float) -> str | None:
@@ -755,13 +1031,20 @@ class AirconOptimizer:
         if not temps:
             return None
         threshold = self.ac_turn_on_threshold * 1.5
-        if self.hvac_mode in ("cool", "auto") and (max(temps) - effective_target) >= threshold:
+        stats = self._temp_stats(temps)
+        if self.hvac_mode in ("cool", "auto") and (stats.maximum - effective_target) >= threshold:
             return "cool"
-        if self.hvac_mode in ("heat", "auto") and (effective_target - min(temps)) >= threshold:
+        if self.hvac_mode in ("heat", "auto") and (effective_target - stats.minimum) >= threshold:
             return "heat"
         return None
 
-    def _determine_optimal_hvac_mode(self, room_states: dict[str, dict[str, Any]], effective_target: float) -> str:
+    def _determine_optimal_hvac_mode(
+        self,
+        room_states: dict[str, dict[str, Any]],
+        effective_target: float,
+        temps: list[float] | None = None,
+        now: float | None = None,
+    ) -> str:
         """Determine optimal HVAC mode based on temperature and humidity conditions.
 
         Logic-based decision making with hysteresis to prevent mode thrashing:
@@ -776,8 +1059,15 @@ class AirconOptimizer:
         cools the air — which fights the heating loop in winter. In heat mode,
         the system mixes only between heat and fan_only.
 
+        ``temps`` is the cycle's valid-temperature list, if already built;
+        ``now`` is the cycle's wall-clock timestamp, if the caller has one.
+
         Returns: "cool", "heat", "dry", or "fan_only"
         """
+        if temps is None:
+            temps = self._valid_temps(room_states)
+        current_time = time.time() if now is None else now
+
         if not self.enable_humidity_control:
             # No humidity control - resolve mode from temperature only
             if self.hvac_mode != "auto":
@@ -787,9 +1077,8 @@ class AirconOptimizer:
                 # outlier room wins over the house average — the average alone
                 # can point the wrong way (e.g. one room at +2°C while the
                 # rest sit just below target would otherwise resolve "heat").
-                temps = self._valid_temps(room_states)
                 if temps:
-                    avg_temp = sum(temps) / len(temps)
+                    avg_temp = self._temp_stats(temps).mean
                     resolved_mode = (
                         self._outlier_conditioning_mode(temps, effective_target)
                         or ("heat" if avg_temp < effective_target else "cool")
@@ -798,7 +1087,6 @@ class AirconOptimizer:
                     resolved_mode = "cool"  # Default fallback
 
             # Update tracking state so _get_effective_operating_mode() stays current
-            current_time = time.time()
             if resolved_mode != self._last_hvac_mode:
                 self._last_hvac_mode = resolved_mode
                 self._last_mode_change_time = current_time
@@ -813,16 +1101,15 @@ class AirconOptimizer:
 
             return resolved_mode
 
-        # Collect valid temperatures and humidities
-        temps = self._valid_temps(room_states)
-        humidities = [s["current_humidity"] for s in room_states.values() if s["current_humidity"] is not None]
-
         if not temps:
             # No temperature data - default to current mode
             return self.hvac_mode if self.hvac_mode != "auto" else "cool"
 
+        # Collect valid humidities
+        humidities = [s["current_humidity"] for s in room_states.values() if s["current_humidity"] is not None]
+
         # Calculate average temperature deviation from target
-        avg_temp = sum(temps) / len(temps)
+        avg_temp = self._temp_stats(temps).mean
         temp_deviation = avg_temp - effective_target
         abs_deviation = abs(temp_deviation)
 
@@ -952,16 +1239,11 @@ class AirconOptimizer:
             )
 
         # Apply hysteresis logic to prevent mode thrashing
-        current_time = time.time()
         should_change_mode = True
 
         if self._last_hvac_mode is not None and optimal_mode != self._last_hvac_mode:
             # We want to change mode - check hysteresis
-            time_since_last_change = (
-                current_time - self._last_mode_change_time
-                if self._last_mode_change_time is not None
-                else float('inf')
-            )
+            time_since_last_change = current_time - self._last_mode_change_time
 
             # Enhanced compressor protection: Check minimum duration and run cycles.
             # Guards exits from a compressor mode — both compressor→fan_only and
@@ -1053,9 +1335,13 @@ class AirconOptimizer:
                 self._mode_start_time = current_time
                 self._compressor_run_cycle_count = 0
 
-        # Enhanced compressor protection: Increment cycle count if in compressor mode
+        # Enhanced compressor protection: count run cycles in compressor mode.
+        # Measured from the mode start in base data polls rather than by
+        # counting calls, so the stretched/tightened adaptive poll doesn't
+        # change how long the minimum-run-cycles guard holds.
         if self.enable_enhanced_compressor_protection and self._current_hvac_mode in ["cool", "heat"]:
-            self._compressor_run_cycle_count += 1
+            mode_duration = current_time - self._mode_start_time if self._mode_start_time else 0
+            self._compressor_run_cycle_count = int(mode_duration // self._base_poll_interval) + 1
             _LOGGER.debug(
                 "Enhanced compressor protection: Cycle count in %s mode: %d (min required: %d)",
                 self._current_hvac_mode, self._compressor_run_cycle_count, self.min_compressor_run_cycles
@@ -1075,34 +1361,40 @@ class AirconOptimizer:
 
         return optimal_mode
 
-    async def _get_outdoor_temperature(self) -> float | None:
+    async def _get_outdoor_temperature(
+        self, state_map: dict[str, Any] | None = None, now: float | None = None
+    ) -> float | None:
         """Get outdoor temperature from weather entity or outdoor sensor.
 
         Uses 1-hour cache to handle temporary sensor unavailability.
+        ``state_map`` is the cycle's state snapshot, if the caller has one.
         """
         CACHE_MAX_AGE = 3600  # 1 hour in seconds
-        current_time = time.time()
+        current_time = time.time() if now is None else now
 
         # Try to get fresh outdoor temperature
         fresh_temp = None
+        states_get = state_map.get if state_map is not None else self.hass.states.get
 
         if self.outdoor_temp_sensor:
-            sensor_state = self.hass.states.get(self.outdoor_temp_sensor)
+            sensor_state = states_get(self.outdoor_temp_sensor)
             fresh_temp = normalize_temperature(sensor_state, "outdoor")
             if fresh_temp is None:
                 _LOGGER.debug("Could not read outdoor temperature sensor")
 
         if fresh_temp is None and self.weather_entity:
-            weather_state = self.hass.states.get(self.weather_entity)
+            weather_state = states_get(self.weather_entity)
             if weather_state:
                 temp = weather_state.attributes.get("temperature")
                 if temp is not None:
                     try:
                         fresh_temp = float(temp)
                         # Weather entities report temp in system's configured unit
-                        temp_unit = weather_state.attributes.get("temperature_unit", "°C")
-                        if temp_unit in ["°F", "fahrenheit", "F"]:
-                            fresh_temp = (fresh_temp - 32) * 5.0 / 9.0
+                        scale, offset = celsius_conversion(
+                            weather_state.attributes.get("temperature_unit", "°C")
+                        )
+                        if scale != 1.0:
+                            fresh_temp = fresh_temp * scale + offset
                             _LOGGER.debug(
                                 "Converted weather temperature from %.1f°F to %.1f°C",
                                 float(temp), fresh_temp
@@ -1114,12 +1406,13 @@ class AirconOptimizer:
         if fresh_temp is not None:
             self._outdoor_temperature = fresh_temp
             self._outdoor_temperature_timestamp = current_time
-            # Track history for trend detection (keep last 2 hours)
-            self._outdoor_temp_history.append((current_time, fresh_temp))
+            # Track history for trend detection (keep last 2 hours). Entries
+            # are appended in time order, so expired ones sit at the front.
+            history = self._outdoor_temp_history
+            history.append((current_time, fresh_temp))
             cutoff = current_time - 7200  # 2 hours
-            self._outdoor_temp_history = [
-                (t, v) for t, v in self._outdoor_temp_history if t >= cutoff
-            ]
+            if history[0][0] < cutoff:
+                del history[:bisect_left(history, cutoff, key=itemgetter(0))]
             return fresh_temp
 
         # No fresh temperature available - check if we have cached value within max age
@@ -1178,21 +1471,11 @@ class AirconOptimizer:
         """
         operating_mode = self._get_effective_operating_mode(room_states)
 
-        if outdoor_temp > 30:
-            raw_adj = -0.5
-            _LOGGER.debug("Hot weather (%.1f°C)", outdoor_temp)
-        elif outdoor_temp > 25:
-            raw_adj = -0.25
-            _LOGGER.debug("Warm weather (%.1f°C)", outdoor_temp)
-        elif outdoor_temp < 15:
-            raw_adj = 0.5
-            _LOGGER.debug("Cold weather (%.1f°C)", outdoor_temp)
-        elif outdoor_temp < 20:
-            raw_adj = 0.25
-            _LOGGER.debug("Cool weather (%.1f°C)", outdoor_temp)
-        else:
-            raw_adj = 0.0
-            _LOGGER.debug("Mild weather (%.1f°C) - no adjustment", outdoor_temp)
+        band, raw_adj = _WEATHER_BANDS[
+            bisect_right(_WEATHER_COLD_BOUNDS, outdoor_temp)
+            + bisect_left(_WEATHER_HOT_BOUNDS, outdoor_temp)
+        ]
+        _LOGGER.debug("%s weather (%.1f°C), base adjustment %.2f°C", band, outdoor_temp, raw_adj)
 
         # Apply trend-based adjustment: if outdoor temp is rising fast,
         # anticipate increased cooling need (and vice versa)
@@ -1215,54 +1498,61 @@ class AirconOptimizer:
         adjusted = base_target + adjustment
         return round(adjusted, 1)
 
-    async def _update_occupancy_state(self) -> None:
-        """Update occupancy state for all rooms with occupancy sensors."""
+    async def _update_occupancy_state(
+        self, now: float | None = None, state_map: dict[str, Any] | None = None
+    ) -> None:
+        """Update occupancy state for all rooms with occupancy sensors.
+
+        ``state_map`` is the cycle's state snapshot, if the caller has one.
+        """
         if not self.enable_occupancy_control or not self.occupancy_sensors:
             return
 
-        current_time = time.time()
+        current_time = time.time() if now is None else now
+        states_get = state_map.get if state_map is not None else self.hass.states.get
 
         for room_name, sensor_entity in self.occupancy_sensors.items():
             # Get occupancy sensor state
-            state = self.hass.states.get(sensor_entity)
+            state = states_get(sensor_entity)
             if not state:
                 _LOGGER.debug("Occupancy sensor %s not found for room %s", sensor_entity, room_name)
                 continue
 
-            is_occupied = state.state in ["on", "home", "occupied", "detected", "motion", "true"]
+            is_occupied = state.state in _OCCUPIED_STATES
 
             # Initialize room occupancy tracking if needed
-            if room_name not in self._room_occupancy_state:
-                self._room_occupancy_state[room_name] = {
-                    "occupied": is_occupied,
-                    "last_seen": current_time if is_occupied else None,
-                }
+            room_state = self._room_occupancy_state.get(room_name)
+            if room_state is None:
+                self._room_occupancy_state[room_name] = RoomOccupancy(
+                    is_occupied, current_time if is_occupied else None
+                )
                 continue
 
-            # Update occupancy state
-            room_state = self._room_occupancy_state[room_name]
-
             if is_occupied:
                 # Room is occupied
-                room_state["occupied"] = True
-                room_state["last_seen"] = current_time
+                room_state.occupied = True
+                room_state.last_seen = current_time
             else:
                 # Room shows no occupancy - check vacancy timeout
-                if room_state["occupied"]:
+                if room_state.occupied:
                     # Was occupied, now vacant - check timeout
                     # Default to distant past to force vacancy if last_seen is missing
-                    last_seen = room_state.get("last_seen", current_time - self.vacancy_timeout - 1)
+                    last_seen = room_state.last_seen
+                    if last_seen is None:
+                        last_seen = current_time - self.vacancy_timeout - 1
                     time_vacant = current_time - last_seen
 
                     if time_vacant >= self.vacancy_timeout:
                         # Vacancy timeout reached - mark as vacant
-                        room_state["occupied"] = False
+                        room_state.occupied = False
                         _LOGGER.info(
                             "Room %s marked as vacant after %d seconds of no activity",
                             room_name, int(time_vacant)
                         )
 
-    def _get_room_effective_target(self, room_name: str, base_target: float) -> float:
+    def _get_room_effective_target(
+        self, room_name: str, base_target: float, operating_mode: str | None = None
+    ) -> float:
         """Get effective target temperature for a room considering occupancy.
 
         For vacant rooms:
@@ -1272,6 +1562,8 @@ class AirconOptimizer:
         Args:
             room_name: Name of the room
             base_target: Base target temperature
+            operating_mode: The cycle's resolved operating mode, if the
+                caller already has it
 
         Returns:
             Effective target temperature for the room
@@ -1281,12 +1573,13 @@ class AirconOptimizer:
 
         # Check occupancy state
         room_state = self._room_occupancy_state.get(room_name)
-        if not room_state or room_state.get("occupied", True):
+        if room_state is None or room_state.occupied:
             # Room is occupied or no occupancy tracking - use base target
             return base_target
 
         # Room is vacant - apply setback
-        operating_mode = self._get_effective_operating_mode()
+        if operating_mode is None:
+            operating_mode = self._get_effective_operating_mode()
         if operating_mode == "cool":
             # Cooling mode - increase target (reduce cooling)
             effective_target = base_target + self.vacant_room_setback
@@ -1304,19 +1597,22 @@ class AirconOptimizer:
 
         return effective_target
 
-    def _update_temp_history(self, room_states: dict[str, dict[str, Any]]) -> None:
+    def _update_temp_history(self, room_states: dict[str, dict[str, Any]], now: float | None = None) -> None:
         """Update temperature history for rate-of-change calculations."""
-        current_time = time.time()
+        current_time = time.time() if now is None else now
+        cutoff = current_time - _TEMP_HISTORY_POLLS * self._base_poll_interval
+        temp_history = self._temp_history
         for room_name, state in room_states.items():
             temp = state.get("current_temperature")
             if temp is None:
                 continue
-            if room_name not in self._temp_history:
-                self._temp_history[room_name] = []
-            self._temp_history[room_name].append((current_time, temp))
-            # Keep only last N points
-            if len(self._temp_history[room_name]) > self._max_history_points:
-                self._temp_history[room_name] = self._temp_history[room_name][-self._max_history_points:]
+            history = temp_history.get(room_name)
+            if history is None:
+                history = temp_history[room_name] = deque(maxlen=self._max_history_points)
+            history.append((current_time, temp))
+            # Drop readings older than the history window
+            while history[0][0] < cutoff:
+                history.popleft()
 
     def _get_temp_rate_of_change(self, room_name: str) -> float | None:
         """Get temperature rate of change in degrees per minute.
@@ -1329,6 +1625,18 @@ class AirconOptimizer:
         if len(history) < 3:
             return None
 
+        # History only grows once per cycle, while the deadband, prediction
+        # and open-window checks each ask for every room's rate
+        key = (len(history), history[-1])
+        cached = self._rate_of_change_cache.get(room_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        rate = self._compute_temp_rate_of_change(room_name, history)
+        self._rate_of_change_cache[room_name] = (key, rate)
+        return rate
+
+    def _compute_temp_rate_of_change(self, room_name: str, history: deque[tuple[float, float]]) -> float:
+        """Uncached body of _get_temp_rate_of_change (needs >= 3 points)."""
         # Extract times and temperatures
         times = [h[0] for h in history]
         temps = [h[1] for h in history]
@@ -1347,7 +1655,7 @@ class AirconOptimizer:
                 if len(filtered_data) >= 3:  # Need at least 3 points after filtering
                     times = [d[0] for d in filtered_data]
                     temps = [d[1] for d in filtered_data]
-                    if len(filtered_data) < len(history):
+                    if len(filtered_data) < len(history) and _LOGGER.isEnabledFor(logging.DEBUG):
                         _LOGGER.debug(
                             "Filtered %d outlier(s) from temperature history for %s",
                             len(history) - len(filtered_data), room_name
@@ -1380,15 +1688,18 @@ class AirconOptimizer:
         return slope_per_second * 60.0
 
     def _predict_temperature(self, room_name: str, current_temp: float,
-                              target_temp: float | None = None) -> float | None:
+                              target_temp: float | None = None,
+                              rate: float | None = None) -> float | None:
         """Predict temperature N minutes in the future based on rate of change.
 
         Uses dampening to account for exponential decay (Newton's law of cooling).
         As temperature approaches target, rate of change slows down.
+        ``rate`` is the room's rate of change, if the caller already has it.
 
         Returns predicted temperature or None if insufficient data.
         """
-        rate = self._get_temp_rate_of_change(room_name)
+        if rate is None:
+            rate = self._get_temp_rate_of_change(room_name)
         if rate is None:
             return None
 
@@ -1414,11 +1725,11 @@ class AirconOptimizer:
         If prediction shows the room will undershoot, reduce fan speed.
         Uses adaptive boost factor based on learned convergence rate if enabled.
         """
-        predicted_temp = self._predict_temperature(room_name, current_temp, target_temp)
-        if predicted_temp is None:
+        rate = self._get_temp_rate_of_change(room_name)
+        if rate is None:
             return base_fan_speed
 
-        rate = self._get_temp_rate_of_change(room_name)
+        predicted_temp = self._predict_temperature(room_name, current_temp, target_temp, rate)
         predicted_diff = predicted_temp - target_temp
 
         # Get adaptive predictive boost factor (or default if not available)
@@ -1490,7 +1801,7 @@ class AirconOptimizer:
         """Check if compressor protection is currently blocking an AC state change."""
         if not self.enable_compressor_protection:
             return False
-        current_time = time.time()
+        current_time = time.monotonic()
         if self._ac_last_turned_off is not None:
             if (current_time - self._ac_last_turned_off) < self.compressor_min_off_time:
                 return True
@@ -1499,11 +1810,31 @@ class AirconOptimizer:
                 return True
         return False
 
-    @staticmethod
-    def _valid_temps(room_states: dict[str, dict[str, Any]]) -> list[float]:
-        """Extract valid (non-None) temperatures from room states."""
+    def _valid_temps(self, room_states: dict[str, dict[str, Any]]) -> list[float]:
+        """Extract valid (non-None) temperatures from room states.
+
+        Returns the optimization cycle's list when called with that cycle's
+        room_states, so helpers falling back to this share it (and the
+        TempStats cached against it).
+        """
+        cycle_temps = self._cycle_temps
+        if cycle_temps is not None and cycle_temps[0] is room_states:
+            return cycle_temps[1]
         return [s["current_temperature"] for s in room_states.values() if s["current_temperature"] is not None]
 
+    def _temp_stats(self, temps: list[float]) -> TempStats:
+        """Return TempStats for a non-empty ``temps`` list.
+
+        The cycle builds valid_temps once and passes that same list to each
+        helper, so the stats are cached against the list object itself.
+        """
+        cached = self._temp_stats_cache
+        if cached is not None and cached[0] is temps:
+            return cached[1]
+        stats = TempStats.from_temps(temps)
+        self._temp_stats_cache = (temps, stats)
+        return stats
+
     def _get_house_effective_target(self, room_states: dict[str, dict[str, Any]]) -> float:
         """Compute the average effective target temperature across all rooms.
 
@@ -1522,6 +1853,17 @@ class AirconOptimizer:
             return sum(targets) / len(targets)
         return self.target_temperature
 
+    def _get_global_effective_target(self, room_states: dict[str, dict[str, Any]]) -> float:
+        """Return this cycle's global effective target (schedule + weather).
+
+        Falls back to the per-room weighted average only when no cycle has
+        populated it yet (e.g. unit-test paths calling helpers directly).
+        """
+        target = self._current_global_effective_target
+        if target is not None:
+            return target
+        return self._get_house_effective_target(room_states)
+
     def _get_adaptive_deadband(self) -> float:
         """Return the current deadband, optionally widened by recent rate-of-change.
 
@@ -1582,19 +1924,15 @@ class AirconOptimizer:
         # override flip the inferred direction (e.g. tip auto-mode into "heat"
         # while the user is actually at/above their global setpoint).
         if room_states:
-            effective_target = (
-                self._current_global_effective_target
-                if self._current_global_effective_target is not None
-                else self._get_house_effective_target(room_states)
-            )
+            effective_target = self._get_global_effective_target(room_states)
             temps = self._valid_temps(room_states)
             if temps:
-                avg_temp = sum(temps) / len(temps)
+                avg_temp = self._temp_stats(temps).mean
                 return "heat" if avg_temp < effective_target else "cool"
 
         return "cool"  # Default fallback
 
-    def _process_away_mode(self) -> None:
+    def _process_away_mode(self, now: float | None = None) -> None:
         """Auto enter/exit vacation mode based on presence entities.
 
         When every configured person/device_tracker has been away for the
@@ -1605,7 +1943,7 @@ class AirconOptimizer:
         if not self.enable_away_mode or not self.away_mode_entities:
             return
 
-        current_time = time.time()
+        current_time = time.time() if now is None else now
         states = [self.hass.states.get(e) for e in self.away_mode_entities]
         known = [s for s in states if s is not None and s.state not in ("unknown", "unavailable")]
         if not known:
@@ -1632,7 +1970,7 @@ class AirconOptimizer:
                 _LOGGER.info("Presence detected - exiting auto-entered vacation mode")
                 self._exit_quick_action_mode()
 
-    def _track_runtime(self, main_climate_state: dict[str, Any] | None) -> None:
+    def _track_runtime(self, main_climate_state: dict[str, Any] | None, now: float | None = None) -> None:
         """Accumulate compressor and blower runtime from climate entity state.
 
         Compressor runtime (cool/heat/dry) resets daily; blower runtime
@@ -1641,7 +1979,7 @@ class AirconOptimizer:
         """
         from homeassistant.util import dt as dt_util
 
-        now_ts = time.time()
+        now_ts = time.time() if now is None else now
         today = dt_util.now().date().isoformat()
         if self._runtime_date != today:
             self._runtime_date = today
@@ -1684,6 +2022,24 @@ class AirconOptimizer:
         self.hass.async_create_task(self._save_compressor_state())
         _LOGGER.info("Filter runtime timer reset")
 
+    def settings_guard(self) -> asyncio.Lock:
+        """Lock to hold while changing settings an optimization cycle reads.
+
+        Use as ``async with optimizer.settings_guard():`` around writes to
+        e.g. target_temperature, hvac_mode, quick-action mode or learning
+        state, so one cycle never mixes old and new values across rooms.
+        """
+        return self._optimize_lock
+
+    async def async_reset_smoothing(self) -> None:
+        """Forget the last fan speeds so the next cycle applies raw speeds.
+
+        Waits for any running cycle, whose recommendation pass may be
+        updating _last_fan_speeds in the executor.
+        """
+        async with self.settings_guard():
+            self._last_fan_speeds = {}
+
     async def async_turn_off_main_ac(self) -> None:
         """Turn off the physical AC (used when the manager climate entity is turned off)."""
         if not self.main_climate_entity:
@@ -1696,10 +2052,10 @@ class AirconOptimizer:
             "climate",
             "set_hvac_mode",
             {"entity_id": self.main_climate_entity, "hvac_mode": "off"},
-            entity_name=f"Main AC ({self.main_climate_entity})"
+            entity_name=self._main_ac_name
         )
         if success:
-            self._ac_last_turned_off = time.time()
+            self._ac_last_turned_off = time.monotonic()
             await self._save_compressor_state()
 
     async def async_optimize(self) -> dict[str, Any]:
@@ -1718,11 +2074,13 @@ class AirconOptimizer:
             }
 
         try:
-            return await self._async_optimize_impl()
+            async with self._optimize_lock:
+                return await self._async_optimize_impl()
         except Exception as e:
             _LOGGER.error("Unexpected error during optimization: %s", e, exc_info=True)
             self._last_error = f"Optimization Error: {e}"
             self._error_count += 1
+            self._update_poll_interval(False, [])
 
             # Return safe default state
             return {
@@ -1740,8 +2098,9 @@ class AirconOptimizer:
     async def _async_optimize_impl(self) -> dict[str, Any]:
         """Implementation of optimization cycle."""
         # Check for manual override - skip optimization if enabled
-        if getattr(self, 'manual_override_enabled', False):
+        if self.manual_override_enabled:
             _LOGGER.debug("Manual override active - skipping optimization cycle")
+            self._update_poll_interval(False, [])
             return {
                 "room_states": {},
                 "recommendations": {},
@@ -1754,7 +2113,6 @@ class AirconOptimizer:
             }
 
         # Start performance tracking
-        import time
         cycle_start = time.time()
 
         # Process quick-action expiry on every poll — not just when the AC is
@@ -1765,7 +2123,7 @@ class AirconOptimizer:
             self._exit_quick_action_mode()
 
         # Presence-linked away mode (auto vacation entry/exit)
-        self._process_away_mode()
+        self._process_away_mode(cycle_start)
 
         active_schedule = None
         effective_target = self.target_temperature
@@ -1785,18 +2143,45 @@ class AirconOptimizer:
             else:
                 self._current_schedule = None
 
+        # One read per watched entity for the whole cycle; the fingerprint,
+        # occupancy, room collection, outdoor temperature and main climate
+        # lookup all share it
+        state_map = self._snapshot_states()
+
+        # Nothing has moved since a cycle that found every room stable: that
+        # cycle's result still holds. Reuse is limited to refreshes arriving
+        # within half a base data poll of it (forced or climate-requested
+        # refreshes). HA schedules the next poll from the truncated loop time,
+        # so a scheduled poll can start up to a second short of the poll
+        # interval; the short window keeps every scheduled poll a full pass so
+        # time-based logic (vacancy timeouts, fan-only idle, runtime counters,
+        # history and learning) keeps advancing.
+        input_fingerprint = self._input_fingerprint(state_map, effective_target)
+        if (
+            self._last_stable_result is not None
+            and input_fingerprint == self._last_input_fingerprint
+            and (cycle_start - self._last_stable_result_time) < self._base_poll_interval / 2
+        ):
+            _LOGGER.debug("Inputs unchanged since last stable cycle - reusing result")
+            result = dict(self._last_stable_result)
+            cycle_end = time.time()
+            self._last_cycle_time_ms = (cycle_end - cycle_start) * 1000
+            result["optimization_cycle_time_ms"] = self._last_cycle_time_ms
+            result.update(self._live_result_fields(cycle_end))
+            return result
+
         # Update occupancy state before collecting room states
-        await self._update_occupancy_state()
+        await self._update_occupancy_state(cycle_start, state_map)
 
         # Collect room states first so the weather adjustment can resolve the
         # operating mode from actual temperatures (instead of last cycle's
         # mode, which is stale/absent on the first cycle).
-        room_states = await self._collect_room_states(effective_target)
+        room_states = await self._collect_room_states(effective_target, state_map)
 
         outdoor_temp = None
         weather_adjustment = 0.0
         if self.enable_weather_adjustment:
-            outdoor_temp = await self._get_outdoor_temperature()
+            outdoor_temp = await self._get_outdoor_temperature(state_map, cycle_start)
             if outdoor_temp is not None:
                 adjusted_target = self._calculate_weather_adjusted_target(
                     effective_target, outdoor_temp, room_states
@@ -1828,39 +2213,47 @@ class AirconOptimizer:
 
         # Always update temperature history (even if predictive control is disabled)
         # This ensures history is available if user enables predictive control later
-        self._update_temp_history(room_states)
+        self._update_temp_history(room_states, cycle_start)
 
         main_climate_state = None
         main_ac_running = False
         if self.main_climate_entity:
-            climate_state = self.hass.states.get(self.main_climate_entity)
+            climate_state = state_map.get(self.main_climate_entity)
             if climate_state:
                 # Standard HA climate entities expose the hvac mode as the
                 # entity STATE, not as an attribute — without the state
                 # fallback, "hvac_mode" is None on real entities and every
                 # downstream mode comparison (turn-off, compressor
                 # protection, redundant-mode-set suppression) silently fails.
-                hvac_mode = climate_state.attributes.get("hvac_mode") or climate_state.state
+                attrs = climate_state.attributes
+                hvac_mode = attrs.get("hvac_mode") or climate_state.state
+                hvac_action = attrs.get("hvac_action")
                 main_climate_state = {
                     "state": climate_state.state,
-                    "temperature": climate_state.attributes.get("temperature"),
-                    "current_temperature": climate_state.attributes.get("current_temperature"),
+                    "temperature": attrs.get("temperature"),
+                    "current_temperature": attrs.get("current_temperature"),
                     "hvac_mode": hvac_mode,
-                    "hvac_action": climate_state.attributes.get("hvac_action"),
+                    "hvac_action": hvac_action,
                 }
-                hvac_action = climate_state.attributes.get("hvac_action")
                 main_ac_running = (
-                    hvac_action in ["cooling", "heating", "drying", "fan"]  # Include more actions
-                    or (hvac_mode and hvac_mode not in ["off", "unavailable"])
+                    hvac_action in _RUNNING_ACTIONS
+                    or (hvac_mode and hvac_mode not in _INACTIVE_MODES)
                 )
 
         # Accumulate compressor/blower runtime for energy insight and filter reminders
-        self._track_runtime(main_climate_state)
+        self._track_runtime(main_climate_state, cycle_start)
+
+        # Valid temperatures, collected once and shared by every consumer below
+        # (including helpers that only receive room_states)
+        valid_temps = self._valid_temps(room_states)
+        self._cycle_temps = (room_states, valid_temps)
 
         # Determine optimal HVAC mode first so _check_if_ac_needed uses current mode
-        optimal_hvac_mode = self._determine_optimal_hvac_mode(room_states, effective_target)
+        optimal_hvac_mode = self._determine_optimal_hvac_mode(
+            room_states, effective_target, valid_temps, cycle_start
+        )
 
-        needs_ac = await self._check_if_ac_needed(room_states, main_ac_running)
+        needs_ac = await self._check_if_ac_needed(room_states, main_ac_running, valid_temps)
 
         # Humidity-only demand: _check_if_ac_needed only considers temperature, so
         # when temp is in deadband but humidity is high the AC would never start
@@ -1881,7 +2274,7 @@ class AirconOptimizer:
             and self.fan_only_idle_minutes > 0
             and optimal_hvac_mode == "fan_only"
             and self._fan_only_since is not None
-            and (time.time() - self._fan_only_since) >= self.fan_only_idle_minutes * 60
+            and (cycle_start - self._fan_only_since) >= self.fan_only_idle_minutes * 60
         ):
             _LOGGER.info(
                 "Fan-only idle timeout reached (%.0f min) - turning AC off",
@@ -1895,14 +2288,8 @@ class AirconOptimizer:
             # Even without auto AC control, we can still switch modes if AC is already on
             await self._set_hvac_mode(optimal_hvac_mode, main_climate_state)
 
-        valid_temps = [
-            state["current_temperature"]
-            for state in room_states.values()
-            if state["current_temperature"] is not None
-        ]
-
         if not valid_temps:
-            time_since_startup = time.time() - self._startup_time if self._startup_time else float('inf')
+            time_since_startup = cycle_start - self._startup_time if self._startup_time else float('inf')
             in_startup_delay = time_since_startup < self._startup_delay_seconds
 
             if in_startup_delay:
@@ -1915,9 +2302,13 @@ class AirconOptimizer:
                 _LOGGER.warning("No valid temperature readings available - skipping optimization")
                 await self._send_notification(
                     "No Temperature Data",
-                    "No valid temperature readings from sensors. Check sensor availability."
+                    "No valid temperature readings from sensors. Check sensor availability.",
+                    force=True,
                 )
 
+            # Back to the base poll so recovering sensors are picked up
+            # promptly rather than at a stretched stable-house interval
+            self._update_poll_interval(False, valid_temps)
             return {
                 "room_states": room_states,
                 "recommendations": {},
@@ -1931,7 +2322,10 @@ class AirconOptimizer:
             }
 
         all_rooms_stable = self._check_rooms_stable(room_states)
-        current_time = time.time()
+        self._update_poll_interval(all_rooms_stable, valid_temps)
+        # One wall-clock view for every scheduling decision in this cycle;
+        # only the cycle-time metric takes a fresh reading at the end
+        current_time = cycle_start
         should_run_optimization = (
             self._last_optimization is None or
             (current_time - self._last_optimization) >= self._optimization_interval
@@ -1944,7 +2338,7 @@ class AirconOptimizer:
                 self.temperature_deadband
             )
 
-        if self._last_optimization is not None:
+        if self._last_optimization is not None and _LOGGER.isEnabledFor(logging.DEBUG):
             time_since_last = current_time - self._last_optimization
             _LOGGER.debug(
                 "Optimization check: interval=%.0fs, time_since_last=%.0fs, should_run=%s",
@@ -1965,15 +2359,24 @@ class AirconOptimizer:
                     current_time - self._last_optimization if self._last_optimization else 0
                 )
 
-                recommendations = self._calculate_recommendations(room_states)
+                if len(room_states) >= _EXECUTOR_ROOM_THRESHOLD:
+                    # Large houses: keep the CPU-bound pass off the event loop
+                    recommendations = await self.hass.async_add_executor_job(
+                        self._calculate_recommendations, room_states, valid_temps
+                    )
+                else:
+                    recommendations = self._calculate_recommendations(room_states, valid_temps)
 
                 # Apply quick action adjustments if active
-                recommendations = self._apply_quick_action_adjustments(recommendations, room_states)
+                if self._quick_action_mode:
+                    recommendations = self._apply_quick_action_adjustments(
+                        recommendations, room_states, cycle_start
+                    )
 
                 await self._apply_recommendations(recommendations)
 
                 if self.main_fan_entity:
-                    main_fan_speed = await self._determine_and_set_main_fan_speed(room_states)
+                    main_fan_speed = await self._determine_and_set_main_fan_speed(room_states, valid_temps)
 
                 if recommendations:
                     self._last_error = None
@@ -2036,10 +2439,6 @@ class AirconOptimizer:
         cycle_time_ms = (cycle_end - cycle_start) * 1000
         self._last_cycle_time_ms = cycle_time_ms
 
-        # Calculate error rate (errors per hour)
-        uptime_hours = (cycle_end - self._startup_time) / 3600 if self._startup_time else 1
-        error_rate = self._error_count / uptime_hours if uptime_hours > 0 else 0
-
         # Track performance data for adaptive learning (only when optimization actually ran)
         if self.learning_manager and self.learning_manager.enabled and optimization_ran:
             # Calculate actual wall-clock interval between cycles (NOT processing time)
@@ -2048,35 +2447,38 @@ class AirconOptimizer:
                 actual_interval = cycle_end - self._last_cycle_timestamp
             self._last_cycle_timestamp = cycle_end
 
+            # Use actual wall-clock interval, not processing time. On first
+            # cycle (no previous timestamp), use optimization_interval as estimate
+            cycle_interval = actual_interval if actual_interval > 0 else self._optimization_interval
+            last_room_temps = self._last_room_temps
+            room_index = self._room_index
+            default_target = self.target_temperature
+            cycles = []
             for room_name, state in room_states.items():
                 current_temp = state.get("current_temperature")
                 if current_temp is None:
                     continue
 
-                # Get previous temperature for this room
-                previous_temp = self._last_room_temps.get(room_name)
-
-                # Get fan speed applied
-                fan_speed = recommendations.get(room_name, 50)
-
-                # Track this cycle - use actual wall-clock interval, not processing time
-                # On first cycle (no previous timestamp), use optimization_interval as estimate
-                cycle_interval = actual_interval if actual_interval > 0 else self._optimization_interval
-                self.learning_manager.tracker.track_cycle(
-                    room_name=room_name,
-                    temp_before=previous_temp if previous_temp is not None else current_temp,
-                    temp_after=current_temp,
-                    fan_speed=fan_speed,
-                    target_temp=state.get("target_temperature", self.target_temperature),
-                    operating_mode=self._get_effective_operating_mode(room_states),
-                    cycle_duration=cycle_interval,
-                )
+                # Previous temperature for this room; stored for next cycle
+                idx = room_index[room_name]
+                previous_temp = last_room_temps[idx]
+                last_room_temps[idx] = current_temp
+                cycles.append((
+                    room_name,
+                    previous_temp if previous_temp is not None else current_temp,
+                    current_temp,
+                    recommendations.get(room_name, 50),  # Fan speed applied
+                    state.get("target_temperature", default_target),
+                ))
 
-                # Store current temp for next cycle
-                self._last_room_temps[room_name] = current_temp
+            self.learning_manager.tracker.track_cycle_batch(
+                cycles,
+                cycle_duration=cycle_interval,
+                operating_mode=self._get_effective_operating_mode(room_states),
+                timestamp=cycle_end,
+            )
 
             # Periodically update learning profiles from collected data
-            current_time = time.time()
             should_update_learning = (
                 self._last_learning_update is None
                 or (current_time - self._last_learning_update) >= self._learning_update_interval
@@ -2095,7 +2497,7 @@ class AirconOptimizer:
                     _LOGGER.debug("Learning profiles update - insufficient data for any rooms yet (need 50+ data points per room)")
                 self._last_learning_update = current_time
 
-        return {
+        result = {
             "room_states": room_states,
             "recommendations": recommendations,
             "optimization_response_text": self._last_optimization_response,
@@ -2103,8 +2505,6 @@ class AirconOptimizer:
             "main_fan_speed": main_fan_speed,
             "main_ac_running": main_ac_running,
             "needs_ac": needs_ac,
-            "last_error": self._last_error,
-            "error_count": self._error_count,
             "active_schedule": active_schedule,
             "effective_target_temperature": effective_target,
             "base_target_temperature": self.target_temperature,
@@ -2112,6 +2512,30 @@ class AirconOptimizer:
             "outdoor_temperature": outdoor_temp,
             # Performance metrics
             "optimization_cycle_time_ms": cycle_time_ms,
+            **self._live_result_fields(cycle_end),
+        }
+
+        if all_rooms_stable and not optimization_ran:
+            self._last_input_fingerprint = input_fingerprint
+            self._last_stable_result = result
+            self._last_stable_result_time = cycle_start
+        else:
+            self._last_stable_result = None
+
+        return result
+
+    def _live_result_fields(self, now: float) -> dict[str, Any]:
+        """Result fields tracking optimizer state rather than the cycle's inputs.
+
+        Refreshed when a stable cycle's result is reused, so error counters,
+        compressor protection and runtime sensors don't report stale values.
+        """
+        # Calculate error rate (errors per hour)
+        uptime_hours = (now - self._startup_time) / 3600 if self._startup_time else 1
+        error_rate = self._error_count / uptime_hours if uptime_hours > 0 else 0
+        return {
+            "last_error": self._last_error,
+            "error_count": self._error_count,
             "total_optimizations_run": self._total_optimizations_run,
             "error_rate_per_hour": round(error_rate, 2),
             # Compressor protection state
@@ -2123,13 +2547,63 @@ class AirconOptimizer:
             "open_window_rooms": sorted(self._open_window_state.keys()),
         }
 
-    async def _collect_room_states(self, target_temperature: float | None = None) -> dict[str, dict[str, Any]]:
+    def _update_poll_interval(self, all_rooms_stable: bool, temps: list[float]) -> None:
+        """Pick the next data poll interval from how settled the house is.
+
+        Stable houses are polled less often; when room temperatures spread
+        well past the balancing target the poll is tightened so transients
+        are caught sooner.
+        """
+        factor = 1.0
+        if all_rooms_stable:
+            factor = _STABLE_POLL_FACTOR
+        elif len(temps) > 1:
+            mean = math.fsum(temps) / len(temps)
+            spread = math.sqrt(math.fsum((t - mean) ** 2 for t in temps) / (len(temps) - 1))
+            if spread > 2 * self.target_room_variance:
+                factor = _DIVERGING_POLL_FACTOR
+
+        poll_interval = self._base_poll_interval * factor
+        if poll_interval != self._poll_interval:
+            _LOGGER.debug(
+                "Data poll interval %.0fs → %.0fs (stable=%s)",
+                self._poll_interval, poll_interval, all_rooms_stable
+            )
+            self._poll_interval = poll_interval
+
+    def _snapshot_states(self) -> dict[str, Any]:
+        """Read the state of every watched entity once for this cycle."""
+        states_get = self.hass.states.get
+        return {entity_id: states_get(entity_id) for entity_id in self._watched_entities}
+
+    def _input_fingerprint(self, state_map: dict[str, Any], effective_target: float) -> tuple:
+        """Snapshot of the inputs a stable cycle's result depends on.
+
+        HA bumps an entity's last_updated on any state or attribute change,
+        so comparing those is enough to tell whether a sensor has moved.
+        """
+        return (
+            effective_target,
+            self.hvac_mode,
+            self.temperature_deadband,
+            self._quick_action_mode,
+            tuple(state.last_updated if state else None for state in state_map.values()),
+        )
+
+    async def _collect_room_states(
+        self,
+        target_temperature: float | None = None,
+        state_map: dict[str, Any] | None = None,
+    ) -> dict[str, dict[str, Any]]:
         """Collect current temperature, humidity, and cover state for all rooms.
 
         Per-room target precedence: active schedule's per-room target >
         per-room override > global effective target. The weather adjustment is
         a relative delta applied by the caller AFTER collection (uniformly to
         all rooms), so it composes with every branch here.
+
+        ``state_map`` is the cycle's state snapshot; entities are read from
+        hass directly when it is not given.
         """
         room_states = {}
         effective_target = target_temperature if target_temperature is not None else self.target_temperature
@@ -2139,19 +2613,18 @@ class AirconOptimizer:
         if self.enable_scheduling and self._current_schedule:
             schedule_room_targets = self._current_schedule.get("schedule_room_targets") or {}
 
-        for room in self.room_configs:
-            room_name = room["room_name"]
-            temp_sensor = room["temperature_sensor"]
-            cover_entity = room["cover_entity"]
-            humidity_sensor = room.get("humidity_sensor")  # Optional
-            room_target_temp = room.get("room_target_temperature")  # Per-room override
+        states_get = state_map.get if state_map is not None else self.hass.states.get
+        for spec in self._room_specs:
+            room_name = spec.name
+            humidity_sensor = spec.humidity_sensor  # Optional
+            room_target_temp = spec.target  # Per-room override
 
-            temp_state = self.hass.states.get(temp_sensor)
+            temp_state = states_get(spec.temp_sensor)
             current_temp = None
 
             if temp_state:
                 # Normalize temperature (handles F→C conversion)
-                current_temp = normalize_temperature(temp_state, room_name)
+                current_temp = self._room_temperature_celsius(temp_state, spec.temp_sensor, room_name)
                 # Validate after normalization
                 if current_temp is not None:
                     current_temp = self._validate_sensor_temperature(current_temp, room_name)
@@ -2159,8 +2632,8 @@ class AirconOptimizer:
             # Collect humidity if sensor is configured
             current_humidity = None
             if humidity_sensor and self.enable_humidity_control:
-                humidity_state = self.hass.states.get(humidity_sensor)
-                if humidity_state and humidity_state.state not in ["unknown", "unavailable", "none", None]:
+                humidity_state = states_get(humidity_sensor)
+                if humidity_state and humidity_state.state not in _UNKNOWN_STATES:
                     try:
                         current_humidity = float(humidity_state.state)
                         # Validate humidity is in realistic range (0-100%)
@@ -2174,21 +2647,26 @@ class AirconOptimizer:
                         _LOGGER.warning("Could not parse humidity for %s: %s", room_name, e)
                         current_humidity = None
 
-            cover_state = self.hass.states.get(cover_entity)
+            cover_state = states_get(spec.cover_entity)
             cover_position = 100  # Default to fully open
 
             if cover_state:
                 pos = cover_state.attributes.get("current_position")
-                if pos not in ["unknown", "unavailable", "none", None]:
+                if pos not in _UNKNOWN_STATES:
                     try:
-                        cover_position = int(float(pos))
+                        # Covers normally report an int (or a digit string);
+                        # only fall back to float parsing for anything else
+                        if isinstance(pos, int) or (isinstance(pos, str) and pos.isdecimal()):
+                            cover_position = int(pos)
+                        else:
+                            cover_position = int(float(pos))
                         # Validate cover position is 0-100
                         if not (0 <= cover_position <= 100):
                             _LOGGER.warning(
                                 "Cover position for %s (%d%%) outside valid range (0-100%%), clamping",
                                 room_name, cover_position
                             )
-                            cover_position = max(0, min(100, cover_position))
+                            cover_position = 0 if cover_position < 0 else 100
                     except (ValueError, TypeError) as e:
                         _LOGGER.warning("Could not parse cover position for %s: %s, using default", room_name, e)
                         cover_position = 100
@@ -2206,61 +2684,96 @@ class AirconOptimizer:
                 "current_humidity": current_humidity,
                 "target_temperature": room_effective_target,
                 "cover_position": cover_position,
-                "temperature_sensor": temp_sensor,
+                "temperature_sensor": spec.temp_sensor,
                 "humidity_sensor": humidity_sensor,
-                "cover_entity": cover_entity,
+                "cover_entity": spec.cover_entity,
             }
 
         return room_states
 
-    def _calculate_recommendations(self, room_states: dict[str, dict[str, Any]]) -> dict[str, int | float]:
-        """Calculate logic-based recommendations for cover positions and AC temperature."""
+    def _calculate_recommendations(
+        self,
+        room_states: dict[str, dict[str, Any]],
+        temps: list[float] | None = None,
+    ) -> dict[str, int | float]:
+        """Calculate logic-based recommendations for cover positions and AC temperature.
+
+        Must not touch event-loop-only APIs: for large houses this runs in the
+        executor (see _EXECUTOR_ROOM_THRESHOLD).
+        """
         recommendations = {}
 
-        base_effective_target = self._get_house_effective_target(room_states)
+        # Resolved once per cycle rather than once per room inside
+        # _calculate_fan_speed / _apply_efficiency_adjustment
+        effective_mode = self._get_effective_operating_mode()
+
+        # Per-room loop: bind the helpers once instead of resolving them
+        # through self for every room
+        room_effective_target_for = self._get_room_effective_target
+
+        # Per-room effective targets (per-room override + occupancy setback),
+        # computed once and shared by the house average and the room loop.
+        # Same result as _get_house_effective_target without a second pass.
+        room_targets = {
+            room_name: room_effective_target_for(room_name, state["target_temperature"], effective_mode)
+            for room_name, state in room_states.items()
+            if state.get("target_temperature") is not None
+        }
+        base_effective_target = (
+            sum(room_targets.values()) / len(room_targets)
+            if room_targets
+            else self.target_temperature
+        )
+        calculate_fan_speed = self._calculate_fan_speed
+        apply_predictive = self._apply_predictive_adjustment if self.enable_predictive_control else None
+        smooth_fan_speed = self._smooth_fan_speed
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
 
         for room_name, state in room_states.items():
             current_temp = state["current_temperature"]
             if current_temp is None:
                 continue
 
-            # Use per-room target from room_states (already includes per-room override)
-            room_base_target = state.get("target_temperature", base_effective_target)
-            # Then apply occupancy setback on top
-            room_effective_target = self._get_room_effective_target(room_name, room_base_target)
+            room_effective_target = room_targets.get(room_name)
+            if room_effective_target is None:
+                # No per-room target: fall back to the house target plus setback
+                room_effective_target = room_effective_target_for(
+                    room_name, base_effective_target, effective_mode
+                )
 
             temp_diff = current_temp - room_effective_target
             abs_temp_diff = abs(temp_diff)
 
             # Calculate raw fan speed (with adaptive bands and efficiency if enabled)
-            raw_fan_speed = self._calculate_fan_speed(temp_diff, abs_temp_diff, room_name)
+            raw_fan_speed = calculate_fan_speed(temp_diff, abs_temp_diff, room_name, effective_mode)
 
             # Apply predictive adjustment BEFORE smoothing to preserve predictive boost effectiveness
             # Predictive control adds proactive adjustments to prevent overshoot
             fan_speed_with_prediction = raw_fan_speed
-            if self.enable_predictive_control:
-                fan_speed_with_prediction = self._apply_predictive_adjustment(
+            if apply_predictive is not None:
+                fan_speed_with_prediction = apply_predictive(
                     room_name, raw_fan_speed, current_temp, room_effective_target
                 )
 
             # Apply smoothing AFTER predictive adjustment to prevent oscillation
             # This ensures the predictive boost isn't dampened by smoothing
-            fan_speed = self._smooth_fan_speed(room_name, fan_speed_with_prediction)
+            fan_speed = smooth_fan_speed(room_name, fan_speed_with_prediction)
 
             recommendations[room_name] = fan_speed
 
-            _LOGGER.debug(
-                "Room %s: temp=%.1f°C, target=%.1f°C, diff=%+.1f°C → fan=%d%%",
-                room_name,
-                current_temp,
-                room_effective_target,
-                temp_diff,
-                fan_speed
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "Room %s: temp=%.1f°C, target=%.1f°C, diff=%+.1f°C → fan=%d%%",
+                    room_name,
+                    current_temp,
+                    room_effective_target,
+                    temp_diff,
+                    fan_speed
+                )
 
         # Apply inter-room balancing if enabled
         if self.enable_room_balancing and len(recommendations) > 1:
-            recommendations = self._apply_room_balancing(recommendations, room_states, base_effective_target)
+            recommendations = self._apply_room_balancing(recommendations, room_states, base_effective_target, temps)
 
         # In dry mode, weight airflow toward the rooms that are actually humid
         if self._dry_mode_active and self.enable_humidity_control:
@@ -2274,7 +2787,7 @@ class AirconOptimizer:
         recommendations = self._normalize_fan_speeds(recommendations)
 
         if self.auto_control_ac_temperature and self.main_climate_entity:
-            ac_temp = self._calculate_ac_temperature(room_states, base_effective_target)
+            ac_temp = self._calculate_ac_temperature(room_states, base_effective_target, temps)
             recommendations["ac_temperature"] = ac_temp
 
         self._last_optimization_response = self._build_optimization_summary(recommendations, room_states)
@@ -2374,12 +2887,14 @@ class AirconOptimizer:
                     "%s mode despite active airflow - pausing conditioning for %.0f min",
                     room_name, rate, operating_mode, self.open_window_pause_minutes
                 )
-                self.hass.async_create_task(self._send_notification(
+                # add_job is thread-safe: this pass may run in the executor
+                self.hass.add_job(
+                    self._send_notification,
                     "Open Window Detected",
                     f"{room_name} appears to have an open window/door "
                     f"(temperature moving {rate:+.2f}°C/min against {operating_mode} mode). "
                     f"Pausing conditioning there for {self.open_window_pause_minutes:.0f} minutes."
-                ))
+                )
 
         return adjusted
 
@@ -2387,25 +2902,33 @@ class AirconOptimizer:
         """Smooth fan speed transitions to prevent rapid oscillation.
 
         Uses learned smoothing parameters if adaptive learning is active,
-        otherwise the configured smoothing settings.
+        otherwise the configured smoothing settings. The per-room choice is
+        cached until the learning state changes.
         """
         if not self.enable_fan_smoothing:
             self._last_fan_speeds[room_name] = new_speed
             return new_speed
 
-        # Get learned smoothing parameters if available
-        if self.learning_manager and self.learning_manager.should_apply_learning(room_name):
-            profile = self.learning_manager.get_profile(room_name)
-            smoothing_factor = profile.optimal_smoothing_factor
-            smoothing_threshold = profile.optimal_smoothing_threshold
-            _LOGGER.debug(
-                "Using learned smoothing for %s: factor=%.2f, threshold=%d",
-                room_name, smoothing_factor, smoothing_threshold
-            )
-        else:
-            # Use configured values (defaults: 0.7 = 70% new / 30% old, threshold 10)
-            smoothing_factor = self.smoothing_factor
-            smoothing_threshold = self.smoothing_threshold
+        state_key = self.learning_manager.learning_state_key() if self.learning_manager else None
+        if state_key != self._smoothing_cache_key:
+            self._smoothing_params_cache.clear()
+            self._smoothing_cache_key = state_key
+
+        params = self._smoothing_params_cache.get(room_name)
+        if params is None:
+            # Get learned smoothing parameters if available
+            if self.learning_manager and self.learning_manager.should_apply_learning(room_name):
+                profile = self.learning_manager.get_profile(room_name)
+                params = (profile.optimal_smoothing_factor, profile.optimal_smoothing_threshold)
+                _LOGGER.debug(
+                    "Using learned smoothing for %s: factor=%.2f, threshold=%d",
+                    room_name, params[0], params[1]
+                )
+            else:
+                # Use configured values (defaults: 0.7 = 70% new / 30% old, threshold 10)
+                params = (self.smoothing_factor, self.smoothing_threshold)
+            self._smoothing_params_cache[room_name] = params
+        smoothing_factor, smoothing_threshold = params
 
         if room_name not in self._last_fan_speeds:
             self._last_fan_speeds[room_name] = new_speed
@@ -2489,11 +3012,13 @@ class AirconOptimizer:
                 scaled = int(speed * scale_factor)
                 normalized[room_name] = max(self.min_airflow_percent, min(100, scaled))
 
-        _LOGGER.debug(
-            "Normalized fan speeds (scale=%.2fx, max %d%%→100%%): %s",
-            scale_factor, max_speed,
-            {k: f"{recommendations[k]}→{normalized[k]}%" for k, v in normalized.items() if k != "ac_temperature"}
-        )
+        # The per-room mapping is only worth building when it will be logged
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Normalized fan speeds (scale=%.2fx, max %d%%→100%%): %s",
+                scale_factor, max_speed,
+                {k: f"{recommendations[k]}→{normalized[k]}%" for k, v in normalized.items() if k != "ac_temperature"}
+            )
 
         return normalized
 
@@ -2511,38 +3036,40 @@ class AirconOptimizer:
         The taper below tier1 also removes the cliff at the deadband boundary
         (50% baseline inside → 35% just outside, instead of dropping to 15%).
         """
-        if abs_temp_diff >= self.overshoot_tier3_threshold:
-            return 5
-        if abs_temp_diff >= self.overshoot_tier2_threshold:
-            return 12
-        if abs_temp_diff >= self.overshoot_tier1_threshold:
-            return 22
+        tier = bisect_right(self._overshoot_tier_bounds, abs_temp_diff)
+        if tier:
+            return _OVERSHOOT_TIER_SPEEDS[tier]
         span = self.overshoot_tier1_threshold - self.temperature_deadband
         if span <= 0:
             return 22
         frac = min(1.0, max(0.0, (abs_temp_diff - self.temperature_deadband) / span))
         return int(round(35 - 13 * frac))
 
-    def _calculate_fan_speed(self, temp_diff: float, abs_temp_diff: float, room_name: str = None) -> int:
+    def _calculate_fan_speed(
+        self,
+        temp_diff: float,
+        abs_temp_diff: float,
+        room_name: str = None,
+        effective_mode: str | None = None,
+    ) -> int:
         """Calculate fan speed based on temperature difference and HVAC mode.
 
         Rooms needing conditioning follow a continuous proportional curve;
         rooms in overshoot follow a monotonically decreasing reduction curve.
         Optionally uses adaptive bands based on learned thermal characteristics.
+        ``effective_mode`` may be passed in by callers that already resolved
+        it for the cycle; otherwise it is resolved here.
         """
+        if effective_mode is None:
+            effective_mode = self._get_effective_operating_mode()
+
         # Get adaptive temperature bands if room_name provided
-        bands = self._get_adaptive_temperature_bands(room_name) if room_name else {
-            'extreme': 4.0, 'very_high': 3.0, 'high': 2.0, 'moderate': 1.5,
-            'slight': 1.0, 'minimal': 0.7, 'very_minimal': 0.5
-        }
+        bands = self._get_adaptive_temperature_bands(room_name) if room_name else _DEFAULT_TEMPERATURE_BANDS
 
         # Within deadband - maintain with moderate circulation
         if abs_temp_diff <= self.temperature_deadband:
             base_speed = 50  # Baseline circulation when at target
         else:
-            # Resolve effective operating mode (handles auto → cool/heat and
-            # dry/fan_only interludes)
-            effective_mode = self._get_effective_operating_mode()
             needs_conditioning = (
                 (effective_mode == "cool" and temp_diff > 0)
                 or (effective_mode == "heat" and temp_diff < 0)
@@ -2557,14 +3084,15 @@ class AirconOptimizer:
                 base_speed = self._overshoot_fan_speed(abs_temp_diff)
 
         if room_name:
-            return self._apply_efficiency_adjustment(base_speed, room_name, abs_temp_diff)
+            return self._apply_efficiency_adjustment(base_speed, room_name, abs_temp_diff, effective_mode)
         return base_speed
 
     def _apply_room_balancing(
         self,
         recommendations: dict[str, int],
         room_states: dict[str, dict[str, Any]],
-        effective_target: float
+        effective_target: float,
+        temps: list[float] | None = None,
     ) -> dict[str, int]:
         """Apply inter-room temperature balancing adjustments.
 
@@ -2583,32 +3111,38 @@ class AirconOptimizer:
             room_states: Current state of all rooms
             effective_target: House-average target (kept for API compatibility;
                 the per-room targets in room_states drive the logic)
+            temps: The cycle's valid temperatures, if already collected
 
         Returns:
             Adjusted recommendations with balancing applied
         """
         # Per-room deviation from each room's own effective target
         deviations: dict[str, float] = {}
+        room_effective_target_for = self._get_room_effective_target
         for room_name, s in room_states.items():
             temp = s.get("current_temperature")
             target = s.get("target_temperature")
             if temp is None or target is None:
                 continue
-            room_effective_target = self._get_room_effective_target(room_name, target)
-            deviations[room_name] = temp - room_effective_target
+            deviations[room_name] = temp - room_effective_target_for(room_name, target)
 
         if len(deviations) < 2:
             self._balancing_active = False
             return recommendations  # Need at least 2 rooms to balance
 
-        dev_values = list(deviations.values())
-        avg_dev = statistics.mean(dev_values)
-        dev_variance = statistics.stdev(dev_values)  # Safe - len >= 2
+        # Plain-float mean / sample stdev (statistics.stdev's exact-fraction
+        # path is needlessly slow for a handful of floats). Deviations are
+        # centred before squaring so uniform rooms give exactly 0.
+        dev_values = deviations.values()
+        n = len(deviations)  # Safe - n >= 2
+        avg_dev = math.fsum(dev_values) / n
+        dev_variance = math.sqrt(math.fsum((d - avg_dev) ** 2 for d in dev_values) / (n - 1))
 
         # Store for diagnostics (house average temp stays raw for display;
         # the variance is target-relative because that's what drives balancing)
-        temps = self._valid_temps(room_states)
-        self._house_avg_temp = statistics.mean(temps) if temps else None
+        if temps is None:
+            temps = self._valid_temps(room_states)
+        self._house_avg_temp = self._temp_stats(temps).mean if temps else None
         self._house_temp_variance = dev_variance
 
         # Check if balancing is needed: deviations spread apart, but their
@@ -2628,6 +3162,17 @@ class AirconOptimizer:
             avg_dev, dev_variance, self.target_room_variance
         )
 
+        # Per-room deviation from the house-average deviation, computed once
+        # and shared by the base bias and every coupling lookup
+        centered = {room: dev - avg_dev for room, dev in deviations.items()}
+        effective_mode = self._get_effective_operating_mode(room_states)
+        use_coupling = self.enable_room_coupling_detection
+        debug_enabled = _LOGGER.isEnabledFor(logging.DEBUG)
+        # Loop-invariant settings, read once rather than per room
+        aggressiveness = self.balancing_aggressiveness
+        learning_manager = self.learning_manager if self.enable_adaptive_balancing else None
+        min_airflow = self.min_airflow_percent
+
         # Apply balancing adjustments
         balanced_recommendations = {}
         for room_name, base_fan_speed in recommendations.items():
@@ -2635,17 +3180,17 @@ class AirconOptimizer:
                 balanced_recommendations[room_name] = base_fan_speed
                 continue
 
-            deviation_from_avg = deviations[room_name] - avg_dev
+            deviation_from_avg = centered[room_name]
 
             # Calculate balancing adjustment
             # Positive deviation = room is hotter than house average
             # Negative deviation = room is cooler than house average
-            balancing_bias = deviation_from_avg * self.balancing_aggressiveness * 100
+            balancing_bias = deviation_from_avg * aggressiveness * 100
 
             # Apply adaptive balancing adjustments if enabled and learning available
-            if self.enable_adaptive_balancing and self.learning_manager:
-                if self.learning_manager.should_apply_learning(room_name):
-                    profile = self.learning_manager.get_profile(room_name)
+            if learning_manager:
+                if learning_manager.should_apply_learning(room_name):
+                    profile = learning_manager.get_profile(room_name)
                     if profile:
                         # 1. Apply learned balancing bias (accumulated historical adjustments)
                         # Clamp to prevent unbounded accumulation over months
@@ -2662,7 +3207,6 @@ class AirconOptimizer:
                         # the flip — fast-cooling cold rooms ended up with LESS heating fan,
                         # the opposite of intent.
                         convergence_adjustment = 0.0
-                        effective_mode = self._get_effective_operating_mode(room_states)
                         if effective_mode == "cool":
                             # Fast heating room needs more cooling in cooling mode.
                             # relative_heat_gain_rate > 1.0 means faster than average.
@@ -2678,18 +3222,21 @@ class AirconOptimizer:
 
                         # 3. Apply room coupling adjustments if enabled
                         # (target-relative, consistent with the base deviation)
-                        if self.enable_room_coupling_detection and profile.coupling_factors:
-                            for coupled_room, coupling_factor in profile.coupling_factors.items():
-                                if coupled_room in deviations:
-                                    coupled_deviation = deviations[coupled_room] - avg_dev
-                                    # If coupled room is hot, this room likely needs adjustment too
-                                    balancing_bias += coupled_deviation * coupling_factor * 5
+                        # If coupled rooms are hot, this room likely needs adjustment too:
+                        # a sparse dot product of coupling factors and centred deviations
+                        if use_coupling and profile.coupling_factors:
+                            balancing_bias += 5 * sum(
+                                centered[coupled_room] * coupling_factor
+                                for coupled_room, coupling_factor in profile.coupling_factors.items()
+                                if coupled_room in centered
+                            )
 
-                        _LOGGER.debug(
-                            "  %s: Applied adaptive balancing (learned_bias=%.1f, convergence_adj=%.1f, %d coupled rooms)",
-                            room_name, clamped_learned_bias, convergence_adjustment,
-                            len(profile.coupling_factors)
-                        )
+                        if debug_enabled:
+                            _LOGGER.debug(
+                                "  %s: Applied adaptive balancing (learned_bias=%.1f, convergence_adj=%.1f, %d coupled rooms)",
+                                room_name, clamped_learned_bias, convergence_adjustment,
+                                len(profile.coupling_factors)
+                            )
 
             # Flip the bias sign for heating mode to ensure correct behavior:
             # Cooling mode (no flip):
@@ -2699,26 +3246,32 @@ class AirconOptimizer:
             #   - Hot room (+deviation) → -bias (after flip) → LESS airflow → LESS heating ✓
             #   - Cold room (-deviation) → +bias (after flip) → MORE airflow → MORE heating ✓
             # Use effective operating mode to correctly handle auto mode
-            if self._get_effective_operating_mode(room_states) == "heat":
+            if effective_mode == "heat":
                 balancing_bias = -balancing_bias
 
             # Apply adjustment
             adjusted_speed = base_fan_speed + balancing_bias
 
             # Enforce minimum airflow and bounds
-            final_speed = max(self.min_airflow_percent, min(100, int(adjusted_speed)))
+            final_speed = max(min_airflow, min(100, int(adjusted_speed)))
 
             balanced_recommendations[room_name] = final_speed
 
-            _LOGGER.debug(
-                "  %s: dev-from-own-target %+.1f°C (vs house %+.1f°C) → base=%d%% + bias=%+.1f%% = %d%% (final=%d%%)",
-                room_name, deviations[room_name], deviation_from_avg,
-                base_fan_speed, balancing_bias, int(adjusted_speed), final_speed
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    "  %s: dev-from-own-target %+.1f°C (vs house %+.1f°C) → base=%d%% + bias=%+.1f%% = %d%% (final=%d%%)",
+                    room_name, deviations[room_name], deviation_from_avg,
+                    base_fan_speed, balancing_bias, int(adjusted_speed), final_speed
+                )
 
         return balanced_recommendations
 
-    def _calculate_ac_temperature(self, room_states: dict[str, dict[str, Any]], effective_target: float) -> float:
+    def _calculate_ac_temperature(
+        self,
+        room_states: dict[str, dict[str, Any]],
+        effective_target: float,
+        temps: list[float] | None = None,
+    ) -> float:
         """Calculate optimal AC temperature setpoint.
 
         Uses the GLOBAL effective target (schedule + weather, no per-room
@@ -2731,7 +3284,8 @@ class AirconOptimizer:
 
         Optionally uses adaptive setpoints based on house-wide cooling efficiency.
         """
-        temps = self._valid_temps(room_states)
+        if temps is None:
+            temps = self._valid_temps(room_states)
         if not temps:
             return effective_target
 
@@ -2744,7 +3298,7 @@ class AirconOptimizer:
             else effective_target
         )
 
-        avg_temp = sum(temps) / len(temps)
+        avg_temp = self._temp_stats(temps).mean
         temp_diff = avg_temp - reference_target
 
         # Get base setpoint using RELATIVE offsets from reference_target.
@@ -2777,22 +3331,10 @@ class AirconOptimizer:
         if operating_mode != "cool":
             return base_setpoint
 
-        # Calculate average efficiency across all rooms with sufficient confidence
-        efficiencies = []
-        for room_name in room_states.keys():
-            if not self.learning_manager.should_apply_learning(room_name):
-                continue
-
-            profile = self.learning_manager.get_profile(room_name)
-            if profile and profile.confidence >= 0.5:
-                efficiencies.append(profile.cooling_efficiency)
-
-        if not efficiencies:
+        avg_efficiency = self._get_house_cooling_efficiency(tuple(room_states))
+        if avg_efficiency is None:
             return base_setpoint
 
-        import statistics
-        avg_efficiency = statistics.mean(efficiencies)
-
         # Adjust setpoint based on house-wide efficiency.
         # In cool mode, base_setpoint = target - offset, so a higher (warmer)
         # setpoint is less aggressive and a lower (colder) setpoint is more
@@ -2820,15 +3362,22 @@ class AirconOptimizer:
     def _apply_quick_action_adjustments(
         self,
         recommendations: dict[str, int],
-        room_states: dict[str, dict[str, Any]]
+        room_states: dict[str, dict[str, Any]],
+        now: float | None = None,
     ) -> dict[str, int]:
-        """Apply quick action mode adjustments to recommendations."""
+        """Apply quick action mode adjustments to recommendations.
+
+        ``now`` is the cycle's wall-clock timestamp; the clock is only read
+        here when the caller does not supply one.
+        """
         if not self._quick_action_mode:
             return recommendations
 
+        if now is None:
+            now = time.time()
+
         # Check expiry with atomic check-and-clear to prevent race conditions
-        import time
-        if self._quick_action_expiry and time.time() > self._quick_action_expiry:
+        if self._quick_action_expiry and now > self._quick_action_expiry:
             # Atomically capture and clear expiry to prevent duplicate exits
             expiry_time = self._quick_action_expiry
             self._quick_action_expiry = None
@@ -2867,7 +3416,6 @@ class AirconOptimizer:
 
         elif self._quick_action_mode == "party":
             # Equalize all rooms quickly - set all to median speed (min 60%)
-            import statistics
             speeds = list(fan_speeds.values())
             median_speed = int(statistics.median(speeds)) if speeds else 60
             target_speed = max(60, median_speed)
@@ -2882,11 +3430,8 @@ class AirconOptimizer:
 
     def _enter_quick_action_mode(self, mode: str, duration_minutes: int = None):
         """Enter a quick action mode."""
-        import time
-
         # Validate mode
-        valid_modes = ["vacation", "boost", "sleep", "party"]
-        if mode not in valid_modes:
+        if mode not in _QUICK_ACTION_DEFAULT_DURATIONS:
             _LOGGER.error("Invalid quick action mode: %s", mode)
             return
 
@@ -2904,15 +3449,7 @@ class AirconOptimizer:
 
         self._quick_action_mode = mode
 
-        # Set default durations
-        default_durations = {
-            "vacation": None,  # Manual exit only
-            "boost": 30,
-            "sleep": 480,  # 8 hours
-            "party": 120,  # 2 hours
-        }
-
-        duration = duration_minutes if duration_minutes else default_durations.get(mode)
+        duration = duration_minutes if duration_minutes else _QUICK_ACTION_DEFAULT_DURATIONS[mode]
 
         if duration:
             self._quick_action_expiry = time.time() + (duration * 60)
@@ -3024,23 +3561,31 @@ class AirconOptimizer:
         - High thermal mass (0.7-1.0): Wider bands for slower response rooms
         - Medium thermal mass (0.4-0.7): Default bands
         - Low thermal mass (0.0-0.4): Tighter bands for fast response rooms
+
+        Results are cached per room until the learning state changes (profile
+        recalculation or learning settings toggled). The returned dict is
+        shared and must not be mutated.
         """
-        # Default bands (in degrees from target)
-        default_bands = {
-            'extreme': 4.0,      # 4°C+ away
-            'very_high': 3.0,    # 3-4°C away
-            'high': 2.0,         # 2-3°C away
-            'moderate': 1.5,     # 1.5-2°C away
-            'slight': 1.0,       # 1-1.5°C away
-            'minimal': 0.7,      # 0.7-1°C away
-            'very_minimal': 0.5, # 0.5-0.7°C away
-        }
+        default_bands = _DEFAULT_TEMPERATURE_BANDS
 
         # Check if adaptive bands are enabled and learning is available
-        if not self.enable_adaptive_bands:
+        if not self.enable_adaptive_bands or not self.learning_manager:
             return default_bands
 
-        if not self.learning_manager or not self.learning_manager.should_apply_learning(room_name):
+        state_key = self.learning_manager.learning_state_key()
+        cached = self._bands_cache.get(room_name)
+        if cached is not None and cached[0] == state_key:
+            return cached[1]
+
+        bands = self._compute_adaptive_temperature_bands(room_name)
+        self._bands_cache[room_name] = (state_key, bands)
+        return bands
+
+    def _compute_adaptive_temperature_bands(self, room_name: str) -> dict[str, float]:
+        """Uncached body of _get_adaptive_temperature_bands."""
+        default_bands = _DEFAULT_TEMPERATURE_BANDS
+
+        if not self.learning_manager.should_apply_learning(room_name):
             return default_bands
 
         profile = self.learning_manager.get_profile(room_name)
@@ -3066,13 +3611,19 @@ class AirconOptimizer:
             )
         else:
             # Medium thermal mass - use defaults
-            multiplier = 1.0
+            return default_bands
 
         # Apply multiplier to all bands
         adaptive_bands = {k: v * multiplier for k, v in default_bands.items()}
         return adaptive_bands
 
-    def _apply_efficiency_adjustment(self, base_speed: int, room_name: str, abs_temp_diff: float = 0.0) -> int:
+    def _apply_efficiency_adjustment(
+        self,
+        base_speed: int,
+        room_name: str,
+        abs_temp_diff: float = 0.0,
+        effective_mode: str | None = None,
+    ) -> int:
         """Adjust fan speed based on learned cooling efficiency.
 
         Uses learned cooling_efficiency to optimize fan speeds:
@@ -3093,29 +3644,24 @@ class AirconOptimizer:
             return base_speed
 
         # Adaptive efficiency only models cooling response — skip in heat mode
-        if self._get_effective_operating_mode() != "cool":
+        if effective_mode is None:
+            effective_mode = self._get_effective_operating_mode()
+        if effective_mode != "cool":
             return base_speed
 
-        if not self.learning_manager or not self.learning_manager.should_apply_learning(room_name):
+        if not self.learning_manager:
             return base_speed
 
-        profile = self.learning_manager.get_profile(room_name)
-        if not profile:
+        # The profile-derived part only changes with the learning state
+        state_key = self.learning_manager.learning_state_key()
+        cached = self._efficiency_cache.get(room_name)
+        if cached is None or cached[0] != state_key:
+            cached = (state_key, *self._compute_efficiency_adjustment(room_name))
+            self._efficiency_cache[room_name] = cached
+        _, efficiency, adjustment = cached
+        if adjustment is None:
             return base_speed
 
-        efficiency = profile.cooling_efficiency
-
-        # Proportional adjustment based on efficiency
-        TARGET_EFFICIENCY = 0.55
-        MAX_ADJUSTMENT = 0.40  # Max ±40% adjustment
-
-        # Calculate proportional adjustment
-        efficiency_deviation = TARGET_EFFICIENCY - efficiency
-        adjustment = efficiency_deviation * MAX_ADJUSTMENT
-
-        # Clamp adjustment to reasonable bounds (±15%)
-        adjustment = max(-0.15, min(0.15, adjustment))
-
         # Scale back downward adjustments when room is far from target.
         # Reaching the target is more important than efficiency savings.
         #   >=2°C from target: no downward adjustment (full cooling priority)
@@ -3128,10 +3674,11 @@ class AirconOptimizer:
                 scale = (2.0 - abs_temp_diff) / 1.0
                 adjustment *= scale
 
-        _LOGGER.debug(
-            "Room %s efficiency-based adjustment: efficiency=%.2f, adjustment=%+.1f%%",
-            room_name, efficiency, adjustment * 100
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Room %s efficiency-based adjustment: efficiency=%.2f, adjustment=%+.1f%%",
+                room_name, efficiency, adjustment * 100
+            )
 
         # Apply adjustment and clamp to valid range (respect min_airflow_percent)
         adjusted_speed = base_speed * (1 + adjustment)
@@ -3139,6 +3686,58 @@ class AirconOptimizer:
 
         return final_speed
 
+    def _compute_efficiency_adjustment(self, room_name: str) -> tuple[float, float | None]:
+        """Return (efficiency, clamped adjustment) from the room's learning profile.
+
+        The adjustment is None when learning doesn't apply to the room.
+        """
+        if not self.learning_manager.should_apply_learning(room_name):
+            return 0.0, None
+
+        profile = self.learning_manager.get_profile(room_name)
+        if not profile:
+            return 0.0, None
+
+        efficiency = profile.cooling_efficiency
+
+        # Proportional adjustment based on efficiency
+        TARGET_EFFICIENCY = 0.55
+        MAX_ADJUSTMENT = 0.40  # Max ±40% adjustment
+
+        # Calculate proportional adjustment
+        efficiency_deviation = TARGET_EFFICIENCY - efficiency
+        adjustment = efficiency_deviation * MAX_ADJUSTMENT
+
+        # Clamp adjustment to reasonable bounds (±15%)
+        return efficiency, max(-0.15, min(0.15, adjustment))
+
+    def _get_house_cooling_efficiency(self, room_names: tuple[str, ...]) -> float | None:
+        """Average learned cooling efficiency over rooms with sufficient confidence.
+
+        Returns None when no room qualifies. Cached until the learning state
+        (or the set of rooms) changes.
+        """
+        learning_manager = self.learning_manager
+        cache_key = (learning_manager.learning_state_key(), room_names)
+        cached = self._house_efficiency_cache
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+
+        total = 0.0
+        count = 0
+        for room_name in room_names:
+            if not learning_manager.should_apply_learning(room_name):
+                continue
+
+            profile = learning_manager.get_profile(room_name)
+            if profile and profile.confidence >= 0.5:
+                total += profile.cooling_efficiency
+                count += 1
+
+        avg_efficiency = total / count if count else None
+        self._house_efficiency_cache = (cache_key, avg_efficiency)
+        return avg_efficiency
+
     def _get_adaptive_predictive_boost(self, room_name: str) -> float:
         """Get predictive boost factor adjusted for room convergence rate.
 
@@ -3146,14 +3745,27 @@ class AirconOptimizer:
         - Fast convergence (<300s): Reduce boost by 30% - room reaches target quickly
         - Slow convergence (>900s): Increase boost by 30% - room needs more help
         - Medium convergence (300-900s): Use default boost factor
-        """
-        base_boost = self.predictive_boost_factor  # Default from config
 
+        Results are cached per room until the learning state changes.
+        """
         # Check if adaptive predictive is enabled
-        if not self.enable_adaptive_predictive:
-            return base_boost
+        if not self.enable_adaptive_predictive or not self.learning_manager:
+            return self.predictive_boost_factor
+
+        state_key = self.learning_manager.learning_state_key()
+        cached = self._boost_cache.get(room_name)
+        if cached is not None and cached[0] == state_key:
+            return cached[1]
 
-        if not self.learning_manager or not self.learning_manager.should_apply_learning(room_name):
+        boost = self._compute_adaptive_predictive_boost(room_name)
+        self._boost_cache[room_name] = (state_key, boost)
+        return boost
+
+    def _compute_adaptive_predictive_boost(self, room_name: str) -> float:
+        """Uncached body of _get_adaptive_predictive_boost."""
+        base_boost = self.predictive_boost_factor  # Default from config
+
+        if not self.learning_manager.should_apply_learning(room_name):
             return base_boost
 
         profile = self.learning_manager.get_profile(room_name)
@@ -3184,33 +3796,51 @@ class AirconOptimizer:
         return adaptive_boost
 
     def _build_optimization_summary(self, recommendations: dict[str, int | float], room_states: dict[str, dict[str, Any]]) -> str:
-        """Build a human-readable summary."""
-        summary_lines = ["Logic-based optimization decisions:"]
-        
+        """Build a human-readable summary.
+
+        Consecutive cycles usually produce identical inputs, so the last
+        summary is reused when nothing it renders has changed.
+        """
+        rows = []
         for room_name, fan_speed in recommendations.items():
             if room_name == "ac_temperature":
-                summary_lines.append(f"AC Temperature: {fan_speed}°C")
+                rows.append((room_name, fan_speed, None, None))
             else:
                 state = room_states.get(room_name)
                 if state and state["current_temperature"] is not None:
-                    temp = state["current_temperature"]
-                    target = state["target_temperature"]
-                    diff = temp - target
-                    summary_lines.append(
-                        f"{room_name}: {temp:.1f}°C (target {target:.1f}°C, {diff:+.1f}°C) → {fan_speed}%"
-                    )
-        
+                    rows.append((room_name, fan_speed, state["current_temperature"], state["target_temperature"]))
+        key = tuple(rows)
+        if key == self._last_summary_key:
+            return self._last_optimization_response
+
+        summary_lines = ["Logic-based optimization decisions:"]
+        for room_name, fan_speed, temp, target in rows:
+            if temp is None:
+                summary_lines.append(f"AC Temperature: {fan_speed}°C")
+            else:
+                diff = temp - target
+                summary_lines.append(
+                    f"{room_name}: {temp:.1f}°C (target {target:.1f}°C, {diff:+.1f}°C) → {fan_speed}%"
+                )
+
+        self._last_summary_key = key
         return "\n".join(summary_lines)
 
     async def _apply_recommendations(self, recommendations: dict[str, int | float]) -> None:
-        """Apply the recommended cover positions and AC temperature."""
+        """Apply the recommended cover positions and AC temperature.
+
+        Rooms that need an update are filtered first; the resulting service
+        calls (and the AC setpoint) are then issued concurrently, so the apply
+        phase waits roughly one round trip instead of one per room.
+        """
         # Check manual override before issuing any commands
-        if getattr(self, 'manual_override_enabled', False):
+        if self.manual_override_enabled:
             _LOGGER.debug("Manual override active - skipping apply_recommendations")
             return
 
+        calls = []
         if "ac_temperature" in recommendations and self.auto_control_ac_temperature and self.main_climate_entity:
-            await self._set_ac_temperature(recommendations["ac_temperature"])
+            calls.append(self._set_ac_temperature(recommendations["ac_temperature"]))
 
         for room_name, position in recommendations.items():
             if room_name == "ac_temperature":
@@ -3221,11 +3851,11 @@ class AirconOptimizer:
                 _LOGGER.debug("Skipping %s - control disabled via override", room_name)
                 continue
 
-            room_config = next((r for r in self.room_configs if r["room_name"] == room_name), None)
-            if not room_config:
+            spec = self._room_spec_by_name.get(room_name)
+            if spec is None:
                 continue
 
-            cover_entity = room_config["cover_entity"]
+            cover_entity = spec.cover_entity
             cover_state = self.hass.states.get(cover_entity)
 
             if not cover_state:
@@ -3258,7 +3888,14 @@ class AirconOptimizer:
                 except (ValueError, TypeError):
                     pass  # Can't parse current position, proceed with update
 
-            # Use retry logic for cover position changes
+            calls.append(self._set_cover_position(room_name, cover_entity, position))
+
+        if calls:
+            await asyncio.gather(*calls)
+
+    async def _set_cover_position(self, room_name: str, cover_entity: str, position: int) -> None:
+        """Set one room's cover position with retries, notifying on failure."""
+        async with self._cover_call_semaphore:
             success = await self._retry_service_call(
                 "cover",
                 "set_cover_position",
@@ -3266,18 +3903,22 @@ class AirconOptimizer:
                 entity_name=f"{room_name} ({cover_entity})"
             )
 
-            if success:
-                _LOGGER.debug("Set cover position for %s (%s) to %d%%", room_name, cover_entity, position)
-            else:
-                await self._send_notification(
-                    "Cover Control Error",
-                    f"Failed to set fan speed for {room_name} after {MAX_RETRIES} attempts"
-                )
+        if success:
+            _LOGGER.debug("Set cover position for %s (%s) to %d%%", room_name, cover_entity, position)
+        else:
+            await self._send_notification(
+                "Cover Control Error",
+                f"Failed to set fan speed for {room_name} after {MAX_RETRIES} attempts"
+            )
 
-    async def _determine_and_set_main_fan_speed(self, room_states: dict[str, dict[str, Any]]) -> str:
+    async def _determine_and_set_main_fan_speed(
+        self,
+        room_states: dict[str, dict[str, Any]],
+        temps: list[float] | None = None,
+    ) -> str:
         """Determine and set the main aircon fan speed."""
         # Check manual override before issuing commands
-        if getattr(self, 'manual_override_enabled', False):
+        if self.manual_override_enabled:
             _LOGGER.debug("Manual override active - skipping main fan speed control")
             return self._last_main_fan_speed or "medium"
 
@@ -3285,24 +3926,19 @@ class AirconOptimizer:
         # a single high-target room override can't quietly pull the weighted
         # average up and trick this into picking LOW when MEDIUM/HIGH is
         # warranted (and vice versa).
-        effective_target = (
-            self._current_global_effective_target
-            if self._current_global_effective_target is not None
-            else self._get_house_effective_target(room_states)
-        )
+        effective_target = self._get_global_effective_target(room_states)
 
-        temps = self._valid_temps(room_states)
+        if temps is None:
+            temps = self._valid_temps(room_states)
         if not temps:
             return "medium"
 
-        avg_temp = sum(temps) / len(temps)
-        max_temp = max(temps)
-        min_temp = min(temps)
-        temp_variance = max_temp - min_temp
-        avg_temp_diff = avg_temp - effective_target
+        stats = self._temp_stats(temps)
+        temp_variance = stats.maximum - stats.minimum
+        avg_temp_diff = stats.mean - effective_target
         avg_deviation = abs(avg_temp_diff)
-        max_temp_diff = max(temp - effective_target for temp in temps)
-        min_temp_diff = min(temp - effective_target for temp in temps)
+        max_temp_diff = stats.maximum - effective_target
+        min_temp_diff = stats.minimum - effective_target
 
         fan_speed = "medium"
 
@@ -3311,31 +3947,29 @@ class AirconOptimizer:
             _LOGGER.debug("Main fan -> LOW: Maintaining (variance: %.1f°C, deviation: %.1f°C)", temp_variance, avg_deviation)
             fan_speed = "low"
         else:
-            # Resolve auto mode to cool/heat for consistent fan speed logic
-            effective_fan_mode = self._get_effective_operating_mode(room_states)
-
-            if effective_fan_mode == "cool":
-                if avg_temp_diff >= self.main_fan_high_threshold or (max_temp_diff >= 3.0 and temp_variance >= 2.0):
-                    fan_speed = "high"
-                    _LOGGER.debug("Main fan -> HIGH: Aggressive cooling (avg: +%.1f°C)", avg_temp_diff)
-                elif avg_temp_diff >= self.main_fan_medium_threshold or temp_variance >= 2.0:
-                    # Moderate demand, or unbalanced rooms needing airflow to equalize
-                    fan_speed = "medium"
-                else:
-                    # Light demand or overcooled - quiet operation
-                    fan_speed = "low"
-                    _LOGGER.debug("Main fan -> LOW: Light cooling demand (avg: %+.1f°C)", avg_temp_diff)
+            # Resolve auto mode to cool/heat for consistent fan speed logic.
+            # Heating mirrors cooling, so both share one ladder on "demand":
+            # the deviation signed so that positive means the room needs
+            # conditioning (above target when cooling, below when heating).
+            if self._get_effective_operating_mode(room_states) == "cool":
+                action = "cooling"
+                demand = avg_temp_diff
+                peak_demand = max_temp_diff
             else:
-                if avg_temp_diff <= -self.main_fan_high_threshold or (min_temp_diff <= -3.0 and temp_variance >= 2.0):
-                    fan_speed = "high"
-                    _LOGGER.debug("Main fan -> HIGH: Aggressive heating (avg: %.1f°C)", avg_temp_diff)
-                elif avg_temp_diff <= -self.main_fan_medium_threshold or temp_variance >= 2.0:
-                    # Moderate demand, or unbalanced rooms needing airflow to equalize
-                    fan_speed = "medium"
-                else:
-                    # Light demand or overheated - quiet operation
-                    fan_speed = "low"
-                    _LOGGER.debug("Main fan -> LOW: Light heating demand (avg: %+.1f°C)", avg_temp_diff)
+                action = "heating"
+                demand = -avg_temp_diff
+                peak_demand = -min_temp_diff
+
+            if demand >= self.main_fan_high_threshold or (peak_demand >= 3.0 and temp_variance >= 2.0):
+                fan_speed = "high"
+                _LOGGER.debug("Main fan -> HIGH: Aggressive %s (avg: %+.1f°C)", action, avg_temp_diff)
+            elif demand >= self.main_fan_medium_threshold or temp_variance >= 2.0:
+                # Moderate demand, or unbalanced rooms needing airflow to equalize
+                fan_speed = "medium"
+            else:
+                # Light demand or overshot target - quiet operation
+                fan_speed = "low"
+                _LOGGER.debug("Main fan -> LOW: Light %s demand (avg: %+.1f°C)", action, avg_temp_diff)
 
         fan_state = self.hass.states.get(self.main_fan_entity)
         if not fan_state:
@@ -3352,7 +3986,7 @@ class AirconOptimizer:
                 "climate",
                 "set_fan_mode",
                 {"entity_id": self.main_fan_entity, "fan_mode": fan_speed},
-                entity_name=f"Main Fan ({self.main_fan_entity})"
+                entity_name=self._main_fan_name
             )
         else:
             preset_modes = fan_state.attributes.get("preset_modes")
@@ -3361,7 +3995,7 @@ class AirconOptimizer:
                     "fan",
                     "set_preset_mode",
                     {"entity_id": self.main_fan_entity, "preset_mode": fan_speed},
-                    entity_name=f"Main Fan ({self.main_fan_entity})"
+                    entity_name=self._main_fan_name
                 )
             else:
                 # Fan doesn't expose low/medium/high presets — fall back to
@@ -3372,7 +4006,7 @@ class AirconOptimizer:
                     "fan",
                     "set_percentage",
                     {"entity_id": self.main_fan_entity, "percentage": pct_map.get(fan_speed, 66)},
-                    entity_name=f"Main Fan ({self.main_fan_entity})"
+                    entity_name=self._main_fan_name
                 )
 
         if success:
@@ -3395,7 +4029,9 @@ class AirconOptimizer:
             return False
 
         deadband = self._get_adaptive_deadband()
+        room_effective_target = self._get_room_effective_target
 
+        # Short-circuits on the first unstable or unreadable room
         for room_name, state in room_states.items():
             current_temp = state.get("current_temperature")
             target_temp = state.get("target_temperature")
@@ -3404,14 +4040,17 @@ class AirconOptimizer:
                 return False
 
             # Apply occupancy setback to get effective target
-            effective_target = self._get_room_effective_target(room_name, target_temp)
-            temp_diff = abs(current_temp - effective_target)
-            if temp_diff > deadband:
+            if abs(current_temp - room_effective_target(room_name, target_temp)) > deadband:
                 return False
 
         return True
 
-    async def _check_if_ac_needed(self, room_states: dict[str, dict[str, Any]], ac_currently_on: bool) -> bool:
+    async def _check_if_ac_needed(
+        self,
+        room_states: dict[str, dict[str, Any]],
+        ac_currently_on: bool,
+        temps: list[float] | None = None,
+    ) -> bool:
         """Check if AC is needed with hysteresis.
 
         Anchors on/off decisions to the GLOBAL effective target (the value the
@@ -3422,19 +4061,15 @@ class AirconOptimizer:
         overheating other rooms. Per-room targets still drive damper logic in
         ``_calculate_fan_speed``.
         """
-        # Fall back to weighted avg only if the optimization cycle hasn't
-        # populated the cached global target yet (unit-test paths).
-        effective_target = (
-            self._current_global_effective_target
-            if self._current_global_effective_target is not None
-            else self._get_house_effective_target(room_states)
-        )
+        effective_target = self._get_global_effective_target(room_states)
 
-        temps = self._valid_temps(room_states)
+        if temps is None:
+            temps = self._valid_temps(room_states)
         if not temps:
             return False
 
-        avg_temp = sum(temps) / len(temps)
+        stats = self._temp_stats(temps)
+        avg_temp = stats.mean
         temp_diff = avg_temp - effective_target
 
         if self.hvac_mode == "cool":
@@ -3443,7 +4078,7 @@ class AirconOptimizer:
                 # avg_temp must be below target by turn_off_threshold
                 # AND max room temp must also be at or below target (all rooms satisfied)
                 # This prevents turning off when we just haven't reached target yet
-                max_temp = max(temps)
+                max_temp = stats.maximum
                 overcooled = (temp_diff <= -self.ac_turn_off_threshold and max_temp <= effective_target)
                 if overcooled:
                     _LOGGER.info("AC turn OFF (overcooled): avg=%.1f°C (%.1f°C below target), max=%.1f°C",
@@ -3452,7 +4087,7 @@ class AirconOptimizer:
             else:
                 # To turn ON in cooling mode, check both average AND worst room
                 # Turn on if: (1) avg exceeds threshold, OR (2) any room is extremely hot
-                max_temp = max(temps)
+                max_temp = stats.maximum
                 max_deviation = max_temp - effective_target
                 turn_on_avg = temp_diff >= self.ac_turn_on_threshold
                 turn_on_outlier = max_deviation >= (self.ac_turn_on_threshold * 1.5)  # 1.5x threshold for outliers
@@ -3473,7 +4108,7 @@ class AirconOptimizer:
                 # avg_temp must be above target by turn_off_threshold
                 # AND min room temp must also be at or above target (all rooms satisfied)
                 # This prevents turning off when we just haven't reached target yet
-                min_temp = min(temps)
+                min_temp = stats.minimum
                 overheated = (temp_diff >= self.ac_turn_off_threshold and min_temp >= effective_target)
                 if overheated:
                     _LOGGER.info("AC turn OFF (overheated): avg=%.1f°C (+%.1f°C above target), min=%.1f°C",
@@ -3482,7 +4117,7 @@ class AirconOptimizer:
             else:
                 # To turn ON in heating mode, check both average AND worst room
                 # Turn on if: (1) avg exceeds threshold, OR (2) any room is extremely cold
-                min_temp = min(temps)
+                min_temp = stats.minimum
                 min_deviation = effective_target - min_temp
                 turn_on_avg = temp_diff <= -self.ac_turn_on_threshold
                 turn_on_outlier = min_deviation >= (self.ac_turn_on_threshold * 1.5)  # 1.5x threshold for outliers
@@ -3499,8 +4134,8 @@ class AirconOptimizer:
         else:  # auto mode - apply hysteresis like cool/heat modes
             if ac_currently_on:
                 # To turn OFF: must have overshot target in the active direction
-                max_temp = max(temps)
-                min_temp = min(temps)
+                max_temp = stats.maximum
+                min_temp = stats.minimum
                 effective_mode = self._get_effective_operating_mode(room_states)
                 if effective_mode == "cool":
                     overcooled = (temp_diff <= -self.ac_turn_off_threshold and max_temp <= effective_target)
@@ -3510,8 +4145,8 @@ class AirconOptimizer:
                     return not overheated
             else:
                 # To turn ON: must exceed turn_on_threshold in either direction
-                max_temp = max(temps)
-                min_temp = min(temps)
+                max_temp = stats.maximum
+                min_temp = stats.minimum
                 max_deviation = max_temp - effective_target
                 min_deviation = effective_target - min_temp
 
@@ -3594,7 +4229,7 @@ class AirconOptimizer:
             "climate",
             "set_hvac_mode",
             {"entity_id": self.main_climate_entity, "hvac_mode": optimal_mode},
-            entity_name=f"Main AC Mode ({self.main_climate_entity})"
+            entity_name=self._main_ac_mode_name
         )
 
         if success and optimal_mode == "dry":
@@ -3621,12 +4256,16 @@ class AirconOptimizer:
             return
 
         # Check manual override before issuing commands
-        if getattr(self, 'manual_override_enabled', False):
+        if self.manual_override_enabled:
             _LOGGER.debug("Manual override active - skipping AC control")
             return
 
         current_mode = main_climate_state.get("hvac_mode")
 
+        # Steady state: AC not needed and already off - nothing to do
+        if not needs_ac and (not current_mode or current_mode == "off"):
+            return
+
         # Critical-room emergency handling: while the critical monitor is
         # driving a recovery, never turn the AC off, and make sure a turn-on
         # uses the mode that actually serves the emergency.
@@ -3640,9 +4279,14 @@ class AirconOptimizer:
                 return
             optimal_mode = "heat" if emergency == "cold" else "cool"
 
+        # Steady state: AC needed and already running in the wanted mode
+        # (checked after the emergency override, which may change that mode)
+        if needs_ac and current_mode == optimal_mode:
+            return
+
         # Compressor protection: enforce minimum on/off times
         if self.enable_compressor_protection:
-            current_time = time.time()
+            current_time = time.monotonic()
 
             if needs_ac and current_mode == "off":
                 # Want to turn ON - check minimum off-time
@@ -3677,12 +4321,12 @@ class AirconOptimizer:
                     "climate",
                     "set_hvac_mode",
                     {"entity_id": self.main_climate_entity, "hvac_mode": optimal_mode},
-                    entity_name=f"Main AC ({self.main_climate_entity})"
+                    entity_name=self._main_ac_name
                 )
                 if success:
-                    self._ac_last_turned_on = time.time()
+                    self._ac_last_turned_on = time.monotonic()
                     # Persist timestamp for compressor protection across restarts
-                    await self._save_compressor_state()
+                    self._schedule_compressor_state_save()
                     await self._send_notification("AC Turned On", f"Smart Manager turned on AC in {optimal_mode} mode")
             else:
                 # AC is already on, just set the optimal mode
@@ -3694,12 +4338,12 @@ class AirconOptimizer:
                     "climate",
                     "set_hvac_mode",
                     {"entity_id": self.main_climate_entity, "hvac_mode": "off"},
-                    entity_name=f"Main AC ({self.main_climate_entity})"
+                    entity_name=self._main_ac_name
                 )
                 if success:
-                    self._ac_last_turned_off = time.time()
+                    self._ac_last_turned_off = time.monotonic()
                     # Persist timestamp for compressor protection across restarts
-                    await self._save_compressor_state()
+                    self._schedule_compressor_state_save()
                     await self._send_notification("AC Turned Off", "Smart Manager turned off AC (rooms at target)")
 
     async def _set_ac_temperature(self, temperature: float) -> None:
@@ -3723,19 +4367,47 @@ class AirconOptimizer:
                 "climate",
                 "set_temperature",
                 {"entity_id": self.main_climate_entity, "temperature": temperature},
-                entity_name=f"Main AC Temperature ({self.main_climate_entity})"
+                entity_name=self._main_ac_temp_name
             )
         except Exception as e:
             _LOGGER.error("Error in _set_ac_temperature: %s", e)
             self._last_error = f"AC Temperature Control Error: {e}"
             self._error_count += 1
 
-    async def _send_notification(self, title: str, message: str) -> None:
-        """Send notifications via persistent_notification and configured services."""
+    async def _send_notification(self, title: str, message: str, force: bool = False) -> None:
+        """Queue a notification for the next batch, or send it now with ``force``.
+
+        Messages raised within _NOTIFICATION_BATCH_SECONDS are grouped by
+        title (duplicates dropped) and sent as one notification per title,
+        so a burst of e.g. per-room cover errors costs one set of service
+        calls instead of one per event.
+        """
         if not self.enable_notifications:
             return
 
-        full_title = f"Smart Aircon Manager: {title}"
+        if force:
+            await self._dispatch_notification(title, message)
+            return
+
+        messages = self._pending_notifications.setdefault(title, [])
+        if message not in messages:
+            messages.append(message)
+        if self._notification_flush_unsub is None:
+            self._notification_flush_unsub = async_call_later(
+                self.hass, _NOTIFICATION_BATCH_SECONDS, self._async_flush_notifications
+            )
+
+    async def _async_flush_notifications(self, _now=None) -> None:
+        """Send every queued notification, one per title."""
+        self._notification_flush_unsub = None
+        pending = self._pending_notifications
+        self._pending_notifications = {}
+        for title, messages in pending.items():
+            await self._dispatch_notification(title, "\n\n".join(messages))
+
+    async def _dispatch_notification(self, title: str, message: str) -> None:
+        """Send notifications via persistent_notification and configured services."""
+        full_title, notification_id = _notification_ids(title)
 
         # Always send persistent notification (HA built-in, always available)
         try:
@@ -3745,27 +4417,40 @@ class AirconOptimizer:
                 {
                     "title": full_title,
                     "message": message,
-                    "notification_id": f"smart_aircon_manager_{title.lower().replace(' ', '_')}",
+                    "notification_id": notification_id,
                 },
                 blocking=False,
             )
         except Exception as e:
             _LOGGER.error("Error sending persistent notification: %s", e)
 
-        # Send to configured additional notification services. "title" is part
-        # of the base notify schema — services that can't render it simply
-        # ignore it, so no message-only fallback call is needed.
-        for service in self.notify_services:
-            try:
-                service_name = service.replace("notify.", "")
-                await self.hass.services.async_call(
-                    "notify",
-                    service_name,
-                    {"title": full_title, "message": message},
+        # Send to configured additional notification services concurrently,
+        # so total latency is the slowest notifier rather than the sum
+        if self._notify_targets:
+            await asyncio.gather(
+                *(
+                    self._send_notify_service(service, service_name, full_title, message)
+                    for service, service_name in self._notify_targets
                 )
-                _LOGGER.debug("Sent notification via %s", service)
-            except Exception as e:
-                _LOGGER.error("Failed to send notification via %s: %s", service, e)
+            )
+
+    async def _send_notify_service(
+        self, service: str, service_name: str, full_title: str, message: str
+    ) -> None:
+        """Send one notification through a notify service, logging failures.
+
+        "title" is part of the base notify schema — services that can't render
+        it simply ignore it, so no message-only fallback call is needed.
+        """
+        try:
+            await self.hass.services.async_call(
+                "notify",
+                service_name,
+                {"title": full_title, "message": message},
+            )
+            _LOGGER.debug("Sent notification via %s", service)
+        except Exception as e:
+            _LOGGER.error("Failed to send notification via %s: %s", service, e)
 
     async def async_cleanup(self) -> None:
         """Cleanup resources on unload."""
@@ -3773,13 +4458,22 @@ class AirconOptimizer:
 
         # Persist compressor protection state and any active quick-action mode
         # so an unload/reload doesn't reset the min on/off timers or drop the
-        # remaining time on sleep/boost/party/vacation.
+        # remaining time on sleep/boost/party/vacation. This also covers a
+        # pending debounced save, so its timer can simply be cancelled.
+        if self._compressor_save_unsub is not None:
+            self._compressor_save_unsub()
+            self._compressor_save_unsub = None
         try:
             await self._save_compressor_state()
             _LOGGER.debug("Saved compressor state")
         except Exception as e:
             _LOGGER.warning("Failed to save compressor state during cleanup: %s", e)
 
+        # Deliver notifications still waiting for their batch window
+        if self._notification_flush_unsub is not None:
+            self._notification_flush_unsub()
+            await self._async_flush_notifications()
+
         # Save learning profiles before shutdown
         if self.learning_manager:
             await self.learning_manager.async_save_profiles()
@@ -43,9 +43,7 @@ class ManualOverrideSwitch(SwitchEntity):
 
         self._hass = None  # Set when added to hass
         # Restore override state from config entry data, or default to False
-        saved_state = config_entry.data.get("manual_override_enabled", False)
-        if not hasattr(self._optimizer, 'manual_override_enabled'):
-            self._optimizer.manual_override_enabled = saved_state
+        self._optimizer.manual_override_enabled = config_entry.data.get("manual_override_enabled", False)
 
     @property
     def device_info(self):
@@ -56,7 +54,7 @@ class ManualOverrideSwitch(SwitchEntity):
     @property
     def is_on(self) -> bool:
         """Return true if manual override is enabled."""
-        return getattr(self._optimizer, 'manual_override_enabled', False)
+        return self._optimizer.manual_override_enabled
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
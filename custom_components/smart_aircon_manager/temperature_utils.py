@@ -8,6 +8,11 @@ from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
 _LOGGER = logging.getLogger(__name__)
 
+_UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN, "unknown", "unavailable", "none"})
+_FAHRENHEIT_UNITS = frozenset({"°F", "fahrenheit", "F"})
+_F_TO_C_SCALE = 5.0 / 9.0
+_F_TO_C_OFFSET = -160.0 / 9.0  # -32 * 5/9
+
 
 def normalize_temperature(
     temp_state: Any,
@@ -25,7 +30,7 @@ def normalize_temperature(
     Returns:
         Temperature in Celsius, or None if unavailable/invalid
     """
-    if not temp_state or temp_state.state in [STATE_UNAVAILABLE, STATE_UNKNOWN, "unknown", "unavailable", "none"]:
+    if not temp_state or temp_state.state in _UNAVAILABLE_STATES:
         return None
 
     try:
@@ -34,9 +39,9 @@ def normalize_temperature(
 
         # Check unit and convert if needed
         unit = temp_state.attributes.get("unit_of_measurement", "°C")
-        if unit in ["°F", "fahrenheit", "F"]:
+        if unit in _FAHRENHEIT_UNITS:
             # Convert Fahrenheit to Celsius
-            current_temp = (current_temp - 32) * 5.0 / 9.0
+            current_temp = current_temp * _F_TO_C_SCALE + _F_TO_C_OFFSET
             _LOGGER.debug(
                 "Converted %s temperature from %.1f°F to %.1f°C",
                 entity_name,
@@ -56,6 +61,17 @@ def normalize_temperature(
         return None
 
 
+def celsius_conversion(unit: str | None) -> tuple[float, float]:
+    """Return the (scale, offset) that converts a reading in ``unit`` to Celsius.
+
+    Lets callers that see the same sensor every cycle resolve the unit once
+    and convert with ``value * scale + offset``.
+    """
+    if unit in _FAHRENHEIT_UNITS:
+        return _F_TO_C_SCALE, _F_TO_C_OFFSET
+    return 1.0, 0.0
+
+
 def validate_temperature_range(
     temp_celsius: float,
     min_temp: float = -50.0,
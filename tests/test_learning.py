@@ -38,6 +38,23 @@ class TestPerformanceTracker:
             tracker.track_cycle("Room1", 25.0, 24.9, 50, 24.0, 30.0)
         assert tracker.get_data_point_count("Room1") == 1000  # Capped at max
 
+    def test_track_cycle_batch_matches_single_calls(self):
+        single = _make_tracker()
+        single.track_cycle("Room1", 25.0, 24.8, 60, 24.0, 30.0, operating_mode="cool")
+        single.track_cycle("Room2", 23.0, 23.1, 40, 24.0, 30.0, operating_mode="cool")
+
+        batch = _make_tracker()
+        batch.track_cycle_batch(
+            [("Room1", 25.0, 24.8, 60, 24.0), ("Room2", 23.0, 23.1, 40, 24.0)],
+            cycle_duration=30.0,
+            operating_mode="cool",
+            timestamp=1000.0,
+        )
+
+        for room in ("Room1", "Room2"):
+            expected = dict(single._data_points[room][0], timestamp=1000.0)
+            assert batch._data_points[room] == [expected]
+
     def test_convergence_rate_insufficient_data(self):
         tracker = _make_tracker()
         tracker.track_cycle("Room1", 25.0, 24.8, 60, 24.0, 30.0)
@@ -203,3 +220,18 @@ class TestLearningManager:
         profile.confidence = 0.9
         mgr.profiles["Room1"] = profile
         assert mgr.should_apply_learning("Room1") is True
+
+    @pytest.mark.asyncio
+    async def test_learning_state_key_changes_on_update_and_toggle(self):
+        hass = MagicMock()
+        hass.async_add_executor_job = AsyncMock(return_value=([], False))
+        mgr = LearningManager(hass, "test", Path("/tmp"))
+        key = mgr.learning_state_key()
+        assert mgr.learning_state_key() == key
+
+        await mgr.async_update_profiles()
+        assert mgr.learning_state_key() != key
+
+        key = mgr.learning_state_key()
+        mgr.enabled = not mgr.enabled
+        assert mgr.learning_state_key() != key
@@ -122,6 +122,14 @@ class TestFanSpeedCalculation:
         outside = opt._calculate_fan_speed(0.6, 0.6)   # Just outside deadband
         assert outside >= within, f"Fan speed dropped from {within}% to {outside}% crossing deadband boundary"
 
+    def test_precomputed_effective_mode_matches_resolved(self):
+        """Passing the cycle's resolved mode gives the same result as resolving it per call."""
+        opt = _make_optimizer(hvac_mode="auto", temperature_deadband=0.5)
+        opt._last_hvac_mode = "heat"
+        for diff in (-3.0, -1.2, 0.2, 1.2, 3.0):
+            assert opt._calculate_fan_speed(diff, abs(diff), "Bedroom", "heat") == \
+                opt._calculate_fan_speed(diff, abs(diff), "Bedroom")
+
 
 class TestFanSpeedSmoothing:
     """Test fan speed smoothing logic."""
@@ -145,6 +153,25 @@ class TestFanSpeedSmoothing:
         result = opt._smooth_fan_speed("Room1", 80)
         assert result == 80
 
+    def test_learned_smoothing_picked_up_after_learning_enabled(self):
+        from custom_components.smart_aircon_manager.learning import LearningManager, LearningProfile
+
+        opt = _make_optimizer(smoothing_factor=0.5)
+        mgr = LearningManager(opt.hass, "test", Path("/tmp"))
+        profile = LearningProfile("Room1")
+        profile.confidence = 0.9
+        profile.optimal_smoothing_factor = 0.9
+        mgr.profiles["Room1"] = profile
+        opt.learning_manager = mgr
+
+        opt._last_fan_speeds["Room1"] = 50
+        assert opt._smooth_fan_speed("Room1", 60) == 55  # Configured factor
+
+        mgr.enabled = True
+        mgr.learning_mode = "active"
+        opt._last_fan_speeds["Room1"] = 50
+        assert opt._smooth_fan_speed("Room1", 60) == 59  # Learned factor
+
 
 class TestRoomBalancing:
     """Test inter-room temperature balancing."""
@@ -271,6 +298,18 @@ class TestWeatherAdjustment:
         result = opt._calculate_weather_adjusted_target(24.0, 22.0)
         assert result == 24.0
 
+    @pytest.mark.asyncio
+    async def test_outdoor_history_drops_entries_older_than_two_hours(self):
+        opt = _make_optimizer(weather_entity="weather.home")
+        opt.hass.states.get = MagicMock(
+            return_value=MagicMock(attributes={"temperature": 30.0, "temperature_unit": "°C"})
+        )
+        now = time.time()
+        opt._outdoor_temp_history = [(now - 9000, 20.0), (now - 7300, 21.0), (now - 3600, 25.0)]
+
+        assert await opt._get_outdoor_temperature() == 30.0
+        assert [v for _, v in opt._outdoor_temp_history] == [25.0, 30.0]
+
 
 class TestScheduleMatching:
     """Test schedule priority matching logic."""
@@ -395,6 +434,39 @@ class TestPredictiveControl:
         assert rate is not None
         assert rate < 0  # Temperature is falling
 
+    def test_rate_of_change_recomputed_only_when_history_grows(self):
+        opt = _make_optimizer(enable_predictive_control=True)
+        now = time.time()
+        opt._update_temp_history({"Room1": {"current_temperature": 24.0}}, now - 60)
+        opt._update_temp_history({"Room1": {"current_temperature": 24.1}}, now - 30)
+        opt._update_temp_history({"Room1": {"current_temperature": 24.2}}, now)
+
+        with patch.object(
+            opt, "_compute_temp_rate_of_change", wraps=opt._compute_temp_rate_of_change
+        ) as compute:
+            first = opt._get_temp_rate_of_change("Room1")
+            assert opt._get_temp_rate_of_change("Room1") == first
+            assert compute.call_count == 1
+
+            opt._update_temp_history({"Room1": {"current_temperature": 25.0}}, now + 30)
+            assert opt._get_temp_rate_of_change("Room1") > first
+            assert compute.call_count == 2
+
+    def test_rate_of_change_independent_of_poll_factor(self):
+        def sensor_reading(t):
+            # Sensor reports every 30s: fast warm-up for 20 min, then slow drift
+            t = t // 30 * 30
+            return round(24.0 + (0.3 * min(t, 1200) + 0.05 * max(t - 1200, 0)) / 60, 2)
+
+        for factor in (0.25, 1.0, 4.0):
+            opt = _make_optimizer(enable_predictive_control=True)
+            step = opt._base_poll_interval * factor
+            t = 0.0
+            while t <= 1800:
+                opt._update_temp_history({"Room1": {"current_temperature": sensor_reading(t)}}, 1000.0 + t)
+                t += step
+            assert opt._get_temp_rate_of_change("Room1") == pytest.approx(0.05, abs=0.01)
+
     def test_predictive_boost_when_rising_toward_target(self):
         opt = _make_optimizer(
             enable_predictive_control=True,
@@ -429,7 +501,7 @@ class TestCompressorProtection:
             compressor_min_off_time=180.0,
         )
         # AC was turned off 60 seconds ago
-        opt._ac_last_turned_off = time.time() - 60
+        opt._ac_last_turned_off = time.monotonic() - 60
         assert opt._is_compressor_protected() is True
 
     def test_protection_allows_turn_on_after_min_time(self):
@@ -438,7 +510,7 @@ class TestCompressorProtection:
             compressor_min_off_time=180.0,
         )
         # AC was turned off 200 seconds ago
-        opt._ac_last_turned_off = time.time() - 200
+        opt._ac_last_turned_off = time.monotonic() - 200
         # _ac_last_turned_on is None, so only off-time check applies
         assert opt._is_compressor_protected() is False
 
@@ -448,7 +520,7 @@ class TestCompressorProtection:
             compressor_min_on_time=180.0,
         )
         # AC was turned on 60 seconds ago
-        opt._ac_last_turned_on = time.time() - 60
+        opt._ac_last_turned_on = time.monotonic() - 60
         assert opt._is_compressor_protected() is True
 
 
@@ -457,7 +529,8 @@ class TestOccupancyControl:
 
     def test_occupied_room_uses_base_target(self):
         opt = _make_optimizer(enable_occupancy_control=True, vacant_room_setback=2.0)
-        opt._room_occupancy_state["Room1"] = {"occupied": True, "last_seen": time.time()}
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Room1"] = RoomOccupancy(True, time.time())
         assert opt._get_room_effective_target("Room1", 24.0) == 24.0
 
     def test_vacant_room_cool_mode_raises_target(self):
@@ -466,7 +539,8 @@ class TestOccupancyControl:
             hvac_mode="cool",
             vacant_room_setback=2.0,
         )
-        opt._room_occupancy_state["Room1"] = {"occupied": False, "last_seen": time.time() - 600}
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Room1"] = RoomOccupancy(False, time.time() - 600)
         result = opt._get_room_effective_target("Room1", 24.0)
         assert result == 26.0  # +2°C setback in cool mode
 
@@ -476,10 +550,24 @@ class TestOccupancyControl:
             hvac_mode="heat",
             vacant_room_setback=2.0,
         )
-        opt._room_occupancy_state["Room1"] = {"occupied": False, "last_seen": time.time() - 600}
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Room1"] = RoomOccupancy(False, time.time() - 600)
         result = opt._get_room_effective_target("Room1", 24.0)
         assert result == 22.0  # -2°C setback in heat mode
 
+    def test_vacant_room_uses_passed_operating_mode(self):
+        opt = _make_optimizer(
+            enable_occupancy_control=True,
+            hvac_mode="cool",
+            vacant_room_setback=2.0,
+        )
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Room1"] = RoomOccupancy(False, time.time() - 600)
+        with patch.object(opt, "_get_effective_operating_mode") as resolve_mode:
+            result = opt._get_room_effective_target("Room1", 24.0, "heat")
+        resolve_mode.assert_not_called()
+        assert result == 22.0
+
     def test_unknown_room_uses_base_target(self):
         opt = _make_optimizer(enable_occupancy_control=True)
         # Room not in occupancy state
@@ -505,6 +593,150 @@ class TestManualOverride:
         opt.hass.services.async_call.assert_not_called()
 
 
+class TestNotificationBatching:
+    """Notifications raised in a burst are coalesced per title."""
+
+    @pytest.mark.asyncio
+    async def test_burst_sent_once_per_title(self):
+        opt = _make_optimizer(enable_notifications=True)
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.async_call_later"
+        ) as call_later:
+            await opt._send_notification("Cover Control Error", "Room A failed")
+            await opt._send_notification("Cover Control Error", "Room B failed")
+            await opt._send_notification("Cover Control Error", "Room A failed")
+        call_later.assert_called_once()
+        opt.hass.services.async_call.assert_not_called()
+
+        await opt._async_flush_notifications()
+        opt.hass.services.async_call.assert_called_once()
+        data = opt.hass.services.async_call.call_args[0][2]
+        assert data["message"] == "Room A failed\n\nRoom B failed"
+
+    @pytest.mark.asyncio
+    async def test_force_bypasses_batch(self):
+        opt = _make_optimizer(enable_notifications=True)
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.async_call_later"
+        ) as call_later:
+            await opt._send_notification("No Temperature Data", "msg", force=True)
+        call_later.assert_not_called()
+        opt.hass.services.async_call.assert_called_once()
+
+
+class TestCompressorStateSave:
+    """Compressor state writes are debounced."""
+
+    @pytest.mark.asyncio
+    async def test_rapid_changes_share_one_save(self):
+        opt = _make_optimizer()
+        opt._save_compressor_state = AsyncMock()
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.async_call_later"
+        ) as call_later:
+            opt._schedule_compressor_state_save()
+            opt._schedule_compressor_state_save()
+        call_later.assert_called_once()
+        opt._save_compressor_state.assert_not_called()
+
+        await opt._async_deferred_compressor_save()
+        opt._save_compressor_state.assert_awaited_once()
+        assert opt._compressor_save_unsub is None
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_pending_save(self):
+        opt = _make_optimizer()
+        opt._save_compressor_state = AsyncMock()
+        await opt.async_flush_compressor_state()
+        opt._save_compressor_state.assert_not_called()
+
+        cancel = MagicMock()
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.async_call_later",
+            return_value=cancel,
+        ):
+            opt._schedule_compressor_state_save()
+        await opt.async_flush_compressor_state()
+
+        cancel.assert_called_once()
+        opt._save_compressor_state.assert_awaited_once()
+        assert opt._compressor_save_unsub is None
+
+    @pytest.mark.asyncio
+    async def test_save_then_load_round_trip(self):
+        import tempfile
+
+        async def run_executor(func, *args):
+            return func(*args)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            saver = _make_optimizer()
+            saver.hass.config.path = MagicMock(return_value=str(Path(tmpdir) / ".storage"))
+            saver.hass.async_add_executor_job = run_executor
+            saver._ac_last_turned_on = time.monotonic() - 60
+            await saver._save_compressor_state()
+            assert saver._compressor_state_file().exists()
+
+            loader = _make_optimizer()
+            loader.hass.config.path = saver.hass.config.path
+            loader.hass.async_add_executor_job = run_executor
+            await loader._load_compressor_state()
+
+        assert time.monotonic() - loader._ac_last_turned_on == pytest.approx(60, abs=5)
+
+
+class TestRetryServiceCall:
+    """Service calls retry with backoff after a failed first attempt."""
+
+    @pytest.mark.asyncio
+    async def test_success_on_retry(self):
+        opt = _make_optimizer()
+        opt.hass.services.async_call = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            assert await opt._retry_service_call("cover", "set_cover_position", {}) is True
+        sleep.assert_awaited_once_with(1.0)
+        assert opt._error_count == 0
+
+    @pytest.mark.asyncio
+    async def test_all_attempts_fail(self):
+        opt = _make_optimizer()
+        opt.hass.services.async_call = AsyncMock(side_effect=RuntimeError("boom"))
+        with patch(
+            "custom_components.smart_aircon_manager.optimizer.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            assert await opt._retry_service_call("cover", "set_cover_position", {}) is False
+        assert opt.hass.services.async_call.await_count == 3
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0]
+        assert opt._error_count == 1
+
+
+class TestApplyRecommendations:
+    """Test cover/AC command dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_skips_moving_and_debounced_covers(self):
+        opt = _make_optimizer()
+        covers = {
+            "cover.lr_fan": MagicMock(state="open", attributes={"current_position": 40}),
+            "cover.br_fan": MagicMock(state="opening", attributes={"current_position": 40}),
+        }
+        opt.hass.states.get = MagicMock(side_effect=covers.get)
+
+        await opt._apply_recommendations({"Living Room": 80, "Bedroom": 80})
+
+        opt.hass.services.async_call.assert_called_once_with(
+            "cover", "set_cover_position",
+            {"entity_id": "cover.lr_fan", "position": 80},
+            blocking=True,
+        )
+
+        opt.hass.services.async_call.reset_mock()
+        await opt._apply_recommendations({"Living Room": 42})
+        opt.hass.services.async_call.assert_not_called()
+
+
 class TestFahrenheitConversion:
     """Test that Fahrenheit sensors are converted before validation (C2 fix)."""
 
@@ -532,6 +764,18 @@ class TestFahrenheitConversion:
         result = opt._validate_sensor_temperature(celsius, "TestRoom")
         assert result is None
 
+    def test_cached_unit_follows_unit_change(self):
+        """The per-sensor conversion is recomputed when the sensor's unit changes."""
+        opt = _make_optimizer()
+        state = MagicMock()
+        state.state = "72.0"
+        state.attributes = {"unit_of_measurement": "°F"}
+        assert abs(opt._room_temperature_celsius(state, "sensor.lr_temp", "Living Room") - 22.22) < 0.01
+
+        state.state = "22.5"
+        state.attributes = {"unit_of_measurement": "°C"}
+        assert opt._room_temperature_celsius(state, "sensor.lr_temp", "Living Room") == 22.5
+
 
 class TestACTemperatureSetpoint:
     """Test _calculate_ac_temperature uses relative offsets (C1 fix)."""
@@ -831,6 +1075,12 @@ class TestDryModeAutoEngage:
             enable_humidity_control=True,
             temperature_deadband=0.5,
             target_humidity=50.0,
+            room_configs=[
+                {"room_name": "Living Room", "temperature_sensor": "sensor.lr_temp",
+                 "cover_entity": "cover.lr_fan", "humidity_sensor": "sensor.lr_humidity"},
+                {"room_name": "Bedroom", "temperature_sensor": "sensor.br_temp",
+                 "cover_entity": "cover.br_fan", "humidity_sensor": "sensor.br_humidity"},
+            ],
         )
         # Make sensor state lookups return sensible values
         temp_state = MagicMock()
@@ -860,9 +1110,6 @@ class TestDryModeAutoEngage:
             return temp_state
 
         opt.hass.states.get.side_effect = state_factory
-        # Add humidity sensor to room config
-        opt.room_configs[0]["humidity_sensor"] = "sensor.lr_humidity"
-        opt.room_configs[1]["humidity_sensor"] = "sensor.br_humidity"
 
         # Spy on _control_main_ac to see what needs_ac value it received
         with patch.object(opt, "_control_main_ac", new=AsyncMock()) as control_spy:
@@ -962,6 +1209,37 @@ class TestOvernightScheduleDays:
         assert active is not None
         assert active["schedule_name"] == "Monday night"
 
+    def test_active_schedule_memoised_per_minute(self):
+        import datetime
+        from unittest.mock import patch as patch_mod
+
+        opt = _make_optimizer(
+            enable_scheduling=True,
+            schedules=[
+                {
+                    "schedule_name": "Evening",
+                    "schedule_days": ["all"],
+                    "schedule_start_time": "18:00",
+                    "schedule_end_time": "22:00",
+                    "schedule_target_temp": 21.0,
+                }
+            ],
+        )
+
+        with patch_mod(
+            "homeassistant.util.dt.now", return_value=datetime.datetime(2026, 5, 18, 22, 0, 10)
+        ):
+            assert opt._get_active_schedule()["schedule_name"] == "Evening"
+        # Still 22:00 - the whole end minute counts and the result is reused
+        with patch_mod(
+            "homeassistant.util.dt.now", return_value=datetime.datetime(2026, 5, 18, 22, 0, 50)
+        ):
+            assert opt._get_active_schedule()["schedule_name"] == "Evening"
+        with patch_mod(
+            "homeassistant.util.dt.now", return_value=datetime.datetime(2026, 5, 18, 22, 1, 0)
+        ):
+            assert opt._get_active_schedule() is None
+
 
 class TestQuickActionRestartRestoration:
     """Quick-action setbacks survive HA restart (target_temp in particular)."""
@@ -1166,6 +1444,125 @@ class TestHvacModeInitialization:
         assert opt._last_hvac_mode == "cool"
 
 
+class TestAdaptivePollInterval:
+    """Data poll interval follows how settled the house is."""
+
+    def test_stable_stretches_and_diverging_compresses(self):
+        opt = _make_optimizer(target_room_variance=0.5)
+        base = opt._base_poll_interval
+
+        opt._update_poll_interval(True, [24.0, 24.1])
+        assert opt._poll_interval == base * 4
+
+        opt._update_poll_interval(False, [24.2, 24.9])
+        assert opt._poll_interval == base
+
+        opt._update_poll_interval(False, [21.0, 27.0])
+        assert opt._poll_interval == base * 0.25
+
+    @pytest.mark.asyncio
+    async def test_no_valid_temps_restores_base_poll(self):
+        opt = _make_optimizer()
+        opt._update_poll_interval(True, [24.0, 24.1])
+        unavailable = MagicMock()
+        unavailable.state = "unavailable"
+        unavailable.attributes = {}
+        opt.hass.states.get.return_value = unavailable
+
+        await opt._async_optimize_impl()
+        assert opt._poll_interval == opt._base_poll_interval
+
+    def test_run_cycles_follow_base_poll_not_call_count(self):
+        opt = _make_optimizer(enable_humidity_control=True, enable_enhanced_compressor_protection=True)
+        base = opt._base_poll_interval
+        room_states = {"Bedroom": {"current_temperature": 27.0, "target_temperature": 24.0, "current_humidity": None}}
+        opt._determine_optimal_hvac_mode(room_states, 24.0, now=1000.0)
+        assert opt._current_hvac_mode == "cool"
+
+        # Tightened polling: many calls within one base poll are one cycle
+        for i in range(1, 4):
+            opt._determine_optimal_hvac_mode(room_states, 24.0, now=1000.0 + i * base * 0.25)
+        assert opt._compressor_run_cycle_count == 1
+
+        opt._determine_optimal_hvac_mode(room_states, 24.0, now=1000.0 + 2 * base)
+        assert opt._compressor_run_cycle_count == 3
+
+
+class TestAdaptiveBandsCache:
+    """Adaptive bands are cached per room until the learning state changes."""
+
+    def test_bands_recomputed_after_profile_update(self):
+        from custom_components.smart_aircon_manager.learning import LearningManager, LearningProfile
+
+        opt = _make_optimizer(enable_adaptive_bands=True)
+        mgr = LearningManager(opt.hass, "test", Path("/tmp"))
+        mgr.enabled = True
+        mgr.learning_mode = "active"
+        profile = LearningProfile("Bedroom")
+        profile.confidence = 0.9
+        profile.thermal_mass = 0.9
+        mgr.profiles["Bedroom"] = profile
+        opt.learning_manager = mgr
+
+        assert opt._get_adaptive_temperature_bands("Bedroom")["extreme"] == pytest.approx(4.8)
+
+        # Same learning state: cached value is served
+        profile.thermal_mass = 0.2
+        assert opt._get_adaptive_temperature_bands("Bedroom")["extreme"] == pytest.approx(4.8)
+
+        # Profiles recalculated: cache invalidated
+        mgr._profiles_version += 1
+        assert opt._get_adaptive_temperature_bands("Bedroom")["extreme"] == pytest.approx(3.2)
+
+        # Learning switched off at runtime: defaults again
+        mgr.enabled = False
+        assert opt._get_adaptive_temperature_bands("Bedroom")["extreme"] == 4.0
+
+    def test_predictive_boost_recomputed_after_profile_update(self):
+        from custom_components.smart_aircon_manager.learning import LearningManager, LearningProfile
+
+        opt = _make_optimizer(enable_adaptive_predictive=True, predictive_boost_factor=0.5)
+        mgr = LearningManager(opt.hass, "test", Path("/tmp"))
+        mgr.enabled = True
+        mgr.learning_mode = "active"
+        profile = LearningProfile("Bedroom")
+        profile.confidence = 0.9
+        profile.avg_convergence_time_seconds = 1200
+        mgr.profiles["Bedroom"] = profile
+        opt.learning_manager = mgr
+
+        assert opt._get_adaptive_predictive_boost("Bedroom") == pytest.approx(0.65)
+
+        profile.avg_convergence_time_seconds = 120
+        assert opt._get_adaptive_predictive_boost("Bedroom") == pytest.approx(0.65)
+
+        mgr._profiles_version += 1
+        assert opt._get_adaptive_predictive_boost("Bedroom") == pytest.approx(0.35)
+
+    def test_efficiency_adjustment_recomputed_after_profile_update(self):
+        from custom_components.smart_aircon_manager.learning import LearningManager, LearningProfile
+
+        opt = _make_optimizer(enable_adaptive_efficiency=True)
+        mgr = LearningManager(opt.hass, "test", Path("/tmp"))
+        mgr.enabled = True
+        mgr.learning_mode = "active"
+        profile = LearningProfile("Bedroom")
+        profile.confidence = 0.9
+        profile.cooling_efficiency = 0.2  # Struggling room: +14% fan
+        mgr.profiles["Bedroom"] = profile
+        opt.learning_manager = mgr
+
+        assert opt._apply_efficiency_adjustment(50, "Bedroom", 0.5, "cool") == 57
+
+        profile.cooling_efficiency = 0.9
+        assert opt._apply_efficiency_adjustment(50, "Bedroom", 0.5, "cool") == 57
+
+        mgr._profiles_version += 1
+        assert opt._apply_efficiency_adjustment(50, "Bedroom", 0.5, "cool") == 43
+        # Far from target: downward adjustment suppressed
+        assert opt._apply_efficiency_adjustment(50, "Bedroom", 2.5, "cool") == 50
+
+
 class TestOptimizerDisabled:
     """Test that optimizer respects is_enabled flag (C4 fix)."""
 
@@ -1185,6 +1582,192 @@ class TestOptimizerDisabled:
         assert result.get("system_off") is not True
 
 
+class TestStableCycleReuse:
+    """Unchanged inputs after a stable cycle reuse the previous result."""
+
+    def _stable_states(self, opt):
+        temp_state = MagicMock()
+        temp_state.state = "24.1"
+        temp_state.attributes = {"unit_of_measurement": "°C"}
+        temp_state.last_updated = "t0"
+        cover_state = MagicMock()
+        cover_state.attributes = {"current_position": 50}
+        cover_state.last_updated = "t0"
+        climate_state = MagicMock()
+        climate_state.state = "off"
+        climate_state.attributes = {"hvac_action": "off"}
+        climate_state.last_updated = "t0"
+
+        def state_factory(eid):
+            if "climate" in eid:
+                return climate_state
+            if "cover" in eid:
+                return cover_state
+            return temp_state
+
+        opt.hass.states.get.side_effect = state_factory
+        return temp_state
+
+    @pytest.mark.asyncio
+    async def test_unchanged_sensors_skip_collection(self):
+        opt = _make_optimizer()
+        self._stable_states(opt)
+        first = await opt._async_optimize_impl()
+
+        with patch.object(opt, "_collect_room_states", new=AsyncMock()) as collect_spy:
+            second = await opt._async_optimize_impl()
+
+        collect_spy.assert_not_called()
+        assert second["room_states"] == first["room_states"]
+
+    @pytest.mark.asyncio
+    async def test_reused_result_reports_live_error_count(self):
+        opt = _make_optimizer()
+        self._stable_states(opt)
+        opt._error_count = 3
+        opt._last_error = "boom"
+        first = await opt._async_optimize_impl()
+        assert first["error_count"] == 3
+
+        opt._error_count = 0
+        opt._last_error = None
+        with patch.object(opt, "_collect_room_states", new=AsyncMock()) as collect_spy:
+            second = await opt._async_optimize_impl()
+
+        collect_spy.assert_not_called()
+        assert second["error_count"] == 0
+        assert second["last_error"] is None
+        assert second["error_rate_per_hour"] == 0
+
+    @pytest.mark.asyncio
+    async def test_scheduled_poll_runs_full_cycle(self):
+        opt = _make_optimizer()
+        self._stable_states(opt)
+        await opt._async_optimize_impl()
+
+        # HA schedules the next poll at int(now) + microsecond offset
+        # (0.05-0.5s) + interval, so it can start just short of the interval
+        stable_start = 1000.95
+        for offset in (0.05, 0.5):
+            scheduled = int(stable_start) + offset + opt._poll_interval
+            opt._last_stable_result_time = time.time() - (scheduled - stable_start)
+            opt._last_input_fingerprint = opt._input_fingerprint(
+                opt._snapshot_states(), opt.target_temperature
+            )
+            with patch.object(opt, "_collect_room_states", wraps=opt._collect_room_states) as collect_spy:
+                await opt._async_optimize_impl()
+            collect_spy.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_sensor_update_forces_full_cycle(self):
+        opt = _make_optimizer()
+        temp_state = self._stable_states(opt)
+        await opt._async_optimize_impl()
+
+        temp_state.state = "26.0"
+        temp_state.last_updated = "t1"
+        result = await opt._async_optimize_impl()
+        assert result["room_states"]["Bedroom"]["current_temperature"] == 26.0
+
+
+class TestLargeHouseCycle:
+    """Large houses run the recommendation pass in the executor."""
+
+    def _large_house(self):
+        import asyncio
+
+        rooms = [
+            {"room_name": f"Room{i}", "temperature_sensor": f"sensor.r{i}_temp", "cover_entity": f"cover.r{i}_fan"}
+            for i in range(8)
+        ]
+        opt = _make_optimizer(room_configs=rooms, main_climate_entity=None)
+        temp_state = MagicMock()
+        temp_state.state = "26.0"
+        temp_state.attributes = {"unit_of_measurement": "°C", "current_position": 50}
+        opt.hass.states.get.return_value = temp_state
+
+        loop = asyncio.get_running_loop()
+
+        async def run_executor(func, *args):
+            return await loop.run_in_executor(None, func, *args)
+
+        opt.hass.async_add_executor_job = run_executor
+        return opt
+
+    @pytest.mark.asyncio
+    async def test_recommendations_run_in_executor(self):
+        import threading
+
+        opt = self._large_house()
+        calculate = opt._calculate_recommendations
+        pass_threads = []
+
+        def threaded_calculate(*args):
+            pass_threads.append(threading.get_ident())
+            return calculate(*args)
+
+        with patch.object(opt, "_calculate_recommendations", side_effect=threaded_calculate):
+            result = await opt.async_optimize()
+
+        assert pass_threads and pass_threads[0] != threading.get_ident()
+        assert all(f"Room{i}" in result["recommendations"] for i in range(8))
+
+    @pytest.mark.asyncio
+    async def test_settings_change_waits_for_threaded_pass(self):
+        import asyncio
+        import threading
+
+        opt = self._large_house()
+        calculate = opt._calculate_recommendations
+        in_pass = threading.Event()
+        release = threading.Event()
+        seen_targets = []
+
+        def blocking_calculate(*args):
+            in_pass.set()
+            release.wait(5)
+            seen_targets.append(opt.target_temperature)
+            return calculate(*args)
+
+        async def change_target():
+            async with opt.settings_guard():
+                opt.target_temperature = 20.0
+
+        with patch.object(opt, "_calculate_recommendations", side_effect=blocking_calculate):
+            cycle = asyncio.ensure_future(opt.async_optimize())
+            while not in_pass.is_set():
+                await asyncio.sleep(0.01)
+            change = asyncio.ensure_future(change_target())
+            await asyncio.sleep(0.05)
+            assert opt.target_temperature == 24.0
+            release.set()
+            await asyncio.gather(cycle, change)
+
+        assert seen_targets == [24.0]
+        assert opt.target_temperature == 20.0
+
+    @pytest.mark.asyncio
+    async def test_cycles_do_not_overlap(self):
+        import asyncio
+
+        opt = _make_optimizer()
+        active = 0
+        max_active = 0
+
+        async def slow_cycle():
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {}
+
+        with patch.object(opt, "_async_optimize_impl", side_effect=slow_cycle):
+            await asyncio.gather(opt.async_optimize(), opt.async_optimize(), opt.async_reset_smoothing())
+
+        assert max_active == 1
+
+
 class TestQuickActionExit:
     """Test that boost/party mode exit doesn't revert user temp changes (H3 fix)."""
 
@@ -1237,7 +1820,8 @@ class TestAutoModeOccupancySetback:
             vacant_room_setback=2.0,
         )
         opt._last_hvac_mode = "cool"
-        opt._room_occupancy_state["Living Room"] = {"occupied": False, "last_seen": time.time() - 600}
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Living Room"] = RoomOccupancy(False, time.time() - 600)
         result = opt._get_room_effective_target("Living Room", 28.0)
         assert result == 30.0  # +2°C setback (cooling direction)
 
@@ -1250,7 +1834,8 @@ class TestAutoModeOccupancySetback:
             vacant_room_setback=2.0,
         )
         opt._last_hvac_mode = "heat"
-        opt._room_occupancy_state["Living Room"] = {"occupied": False, "last_seen": time.time() - 600}
+        from custom_components.smart_aircon_manager.optimizer import RoomOccupancy
+        opt._room_occupancy_state["Living Room"] = RoomOccupancy(False, time.time() - 600)
         result = opt._get_room_effective_target("Living Room", 22.0)
         assert result == 20.0  # -2°C setback (heating direction)
 
@@ -1473,3 +2058,21 @@ class TestHeatModeDryModeSuppression:
         }
         result = opt._determine_optimal_hvac_mode(room_states, 24.0)
         assert result == "heat"
+
+
+class TestTempStats:
+    """Test the per-cycle temperature summary shared by the AC/fan helpers."""
+
+    def test_stats_values(self):
+        opt = _make_optimizer()
+        stats = opt._temp_stats([22.0, 25.0, 23.0])
+        assert stats.mean == pytest.approx(70.0 / 3)
+        assert stats.minimum == 22.0
+        assert stats.maximum == 25.0
+
+    def test_stats_cached_per_list(self):
+        opt = _make_optimizer()
+        temps = [22.0, 25.0]
+        assert opt._temp_stats(temps) is opt._temp_stats(temps)
+        # A new list (next cycle) is summarised afresh
+        assert opt._temp_stats([20.0, 21.0]).maximum == 21.0